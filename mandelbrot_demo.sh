@@ -1,8 +1,10 @@
 #!/bin/bash
 
+export MANDELBROT_WORKERS=${MANDELBROT_WORKERS:-10}
+
 uv run mandelbrot_host.py
-for i in {1..10}; do
-    uv run mandelbrot_worker.py &
+for i in $(seq 1 $MANDELBROT_WORKERS); do
+    WORKER_SHARD=$((i - 1)) uv run mandelbrot_worker.py &
 done
 uv run mandelbrot_render.py &
 wait
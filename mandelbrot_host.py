@@ -1,16 +1,18 @@
 #!/usr/bin/env python3
 """
 Mandelbrot Set Generator Host
-Divides canvas into 4 quarters and posts coordinates to Redis streams
+Divides canvas into a grid of tiles and posts coordinates to Redis streams
 """
 
 import redis
-import json
-import time
-from typing import Tuple, List, Dict
+import math
+import os
+import numpy as np
+from typing import Optional
 
 class MandelbrotHost:
     def __init__(self, canvas_width: int = 800, canvas_height: int = 600, 
+                 num_workers: Optional[int] = None, tiles_per_worker: int = 16,
                  redis_host: str = 'localhost', redis_port: int = 6379):
         """
         Initialize the Mandelbrot host with canvas dimensions and Redis connection
@@ -18,11 +20,20 @@ class MandelbrotHost:
         Args:
             canvas_width: Width of the canvas in pixels
             canvas_height: Height of the canvas in pixels
+            num_workers: Number of workers sharing the render (defaults to MANDELBROT_WORKERS env var or 10)
+            tiles_per_worker: Tiles to post per worker so faster workers can pick up the slack
             redis_host: Redis server hostname
             redis_port: Redis server port
         """
         self.canvas_width = canvas_width
         self.canvas_height = canvas_height
+        self.num_workers = num_workers or int(os.getenv('MANDELBROT_WORKERS', '10'))
+        
+        # Lay out at least num_workers * tiles_per_worker tiles in a grid
+        # whose cells roughly match the canvas aspect ratio
+        tile_count = self.num_workers * tiles_per_worker
+        self.tile_columns = max(1, round(math.sqrt(tile_count * canvas_width / canvas_height)))
+        self.tile_rows = math.ceil(tile_count / self.tile_columns)
         
         # Connect to Redis
         try:
@@ -33,138 +44,116 @@ class MandelbrotHost:
             print(f"Failed to connect to Redis at {redis_host}:{redis_port}")
             raise
         
-        # Stream name for Mandelbrot work distribution
-        self.stream_name = "mandelbrot:work"
+        # Work is sharded across one stream per worker, so each worker reads
+        # its own stream with plain XREAD and no consumer group bookkeeping
+        self.stream_names = [f"mandelbrot:work:{shard}" for shard in range(self.num_workers)]
         self.result_stream_name = "mandelbrot:results"
         
-    def get_quarter_coordinates(self) -> List[Dict[str, Tuple[int, int]]]:
+    def get_tile_coordinates(self) -> np.ndarray:
         """
-        Divide the canvas into 4 quarters and return their coordinates
+        Divide the canvas into a grid of tiles and return their coordinates
         
         Returns:
-            List of dictionaries containing top_left and bottom_right coordinates for each quarter
+            int32 array of shape (tile_rows * tile_columns, 4) with one
+            (top_left_x, top_left_y, bottom_right_x, bottom_right_y) row per
+            tile, in row-major grid order
         """
-        half_width = self.canvas_width // 2
-        half_height = self.canvas_height // 2
+        x_edges = np.arange(self.tile_columns + 1) * self.canvas_width // self.tile_columns
+        y_edges = np.arange(self.tile_rows + 1) * self.canvas_height // self.tile_rows
         
-        quarters = [
-            {
-                "quarter": "top_left",
-                "top_left": (0, 0),
-                "bottom_right": (half_width, half_height)
-            },
-            {
-                "quarter": "top_right", 
-                "top_left": (half_width, 0),
-                "bottom_right": (self.canvas_width, half_height)
-            },
-            {
-                "quarter": "bottom_left",
-                "top_left": (0, half_height),
-                "bottom_right": (half_width, self.canvas_height)
-            },
-            {
-                "quarter": "bottom_right",
-                "top_left": (half_width, half_height),
-                "bottom_right": (self.canvas_width, self.canvas_height)
-            }
-        ]
+        top_left_x, top_left_y = np.meshgrid(x_edges[:-1], y_edges[:-1])
+        bottom_right_x, bottom_right_y = np.meshgrid(x_edges[1:], y_edges[1:])
         
-        return quarters
+        return np.stack([top_left_x.ravel(), top_left_y.ravel(),
+                         bottom_right_x.ravel(), bottom_right_y.ravel()], axis=1).astype(np.int32)
     
-    def post_quarters_to_redis(self) -> None:
+    def post_tiles_to_redis(self) -> None:
         """
-        Post each quarter's coordinates to Redis stream
+        Post each tile's coordinates to the work streams
+
+        Tiles are dealt round-robin across the worker shards, so each worker
+        gets tiles from all over the canvas rather than one expensive band.
         """
-        quarters = self.get_quarter_coordinates()
+        tiles = self.get_tile_coordinates()
+        
+        # Skip empty tiles, which happen when the grid is finer than the canvas
+        non_empty = (tiles[:, 2] > tiles[:, 0]) & (tiles[:, 3] > tiles[:, 1])
+        tile_indices = np.flatnonzero(non_empty)
         
         print(f"Canvas size: {self.canvas_width}x{self.canvas_height}")
-        print(f"Posting {len(quarters)} quarters to Redis stream '{self.stream_name}'")
+        print(f"Tile grid: {self.tile_columns}x{self.tile_rows} for {self.num_workers} workers")
+        print(f"Posting {len(tile_indices)} tiles to {len(self.stream_names)} Redis work streams")
         
-        for quarter in quarters:
-            # Prepare the stream entry data
+        # Queue every XADD on one pipeline so posting costs a single round trip
+        pipe = self.redis_client.pipeline(transaction=False)
+        tile_names = []
+        for position, index in enumerate(tile_indices.tolist()):
+            top_left_x, top_left_y, bottom_right_x, bottom_right_y = tiles[index].tolist()
+            tile_name = f"tile_{index // self.tile_columns}_{index % self.tile_columns}"
+            tile_names.append(tile_name)
+            
+            # Prepare the stream entry data. The entry ID already records when
+            # it was added, so there is no separate timestamp field
             stream_data = {
-                "quarter_name": quarter["quarter"],
-                "top_left_x": quarter["top_left"][0],
-                "top_left_y": quarter["top_left"][1],
-                "bottom_right_x": quarter["bottom_right"][0],
-                "bottom_right_y": quarter["bottom_right"][1],
-                "timestamp": int(time.time()),
+                "tile_name": tile_name,
+                "top_left_x": top_left_x,
+                "top_left_y": top_left_y,
+                "bottom_right_x": bottom_right_x,
+                "bottom_right_y": bottom_right_y,
                 "canvas_width": self.canvas_width,
                 "canvas_height": self.canvas_height
             }
             
-            # Add entry to Redis stream
-            stream_id = self.redis_client.xadd(self.stream_name, stream_data)
-            
-            print(f"Posted {quarter['quarter']}: "
-                  f"({quarter['top_left'][0]}, {quarter['top_left'][1]}) to "
-                  f"({quarter['bottom_right'][0]}, {quarter['bottom_right'][1]}) "
+            # Add entry to this tile's worker shard
+            pipe.xadd(self.stream_names[position % len(self.stream_names)], stream_data)
+        
+        stream_ids = pipe.execute()
+        
+        for index, tile_name, stream_id in zip(tile_indices.tolist(), tile_names, stream_ids):
+            top_left_x, top_left_y, bottom_right_x, bottom_right_y = tiles[index].tolist()
+            print(f"Posted {tile_name}: "
+                  f"({top_left_x}, {top_left_y}) to "
+                  f"({bottom_right_x}, {bottom_right_y}) "
                   f"[Stream ID: {stream_id}]")
     
     def clear_streams(self) -> None:
         """
-        Clear the Redis stream (useful for testing)
+        Clear the Redis streams (useful for testing)
         """
         try:
-            self.redis_client.delete(self.stream_name)
-            print(f"Cleared Redis stream '{self.stream_name}'")
+            # Remove shards left over from a run with more workers too
+            stale_streams = set(self.redis_client.scan_iter(match="mandelbrot:work:*", _type="stream"))
+            for stream_name in sorted(stale_streams.union(self.stream_names)):
+                self.redis_client.delete(stream_name)
+                print(f"Cleared Redis stream '{stream_name}'")
             self.redis_client.delete(self.result_stream_name)
             print(f"Cleared Redis stream '{self.result_stream_name}'")
         except Exception as e:
             print(f"Error clearing stream: {e}")
     
-    def create_consumer_group(self, group_name: str = "workers") -> None:
-        """
-        Create a Redis stream consumer group
-        
-        Args:
-            group_name: Name of the consumer group to create
-        """
-        try:
-            # Create consumer group starting from the beginning of the stream
-            self.redis_client.xgroup_create(self.stream_name, group_name, id='0', mkstream=True)
-            print(f"Created consumer group '{group_name}' for stream '{self.stream_name}'")
-        except redis.ResponseError as e:
-            if "BUSYGROUP" in str(e):
-                print(f"Consumer group '{group_name}' already exists")
-            else:
-                print(f"Error creating consumer group: {e}")
-    
     def show_stream_info(self) -> None:
         """
-        Display information about the Redis stream
+        Display information about the Redis work streams
         """
-        try:
-            stream_info = self.redis_client.xinfo_stream(self.stream_name)
-            print(f"\nStream '{self.stream_name}' info:")
-            print(f"  Length: {stream_info['length']}")
-            print(f"  First entry ID: {stream_info.get('first-entry', 'None')}")
-            print(f"  Last entry ID: {stream_info.get('last-entry', 'None')}")
-            
-            # Show all entries in the stream
-            entries = self.redis_client.xrange(self.stream_name)
-            print(f"\nStream entries:")
-            for entry_id, fields in entries:
-                print(f"  {entry_id}: {fields}")
-            
-            # Show consumer group info
+        for stream_name in self.stream_names:
             try:
-                groups = self.redis_client.xinfo_groups(self.stream_name)
-                if groups:
-                    print(f"\nConsumer groups:")
-                    for group in groups:
-                        print(f"  Group: {group['name']}, Consumers: {group['consumers']}, Pending: {group['pending']}")
-                else:
-                    print(f"\nNo consumer groups found")
-            except redis.ResponseError:
-                print(f"\nNo consumer groups found")
+                stream_info = self.redis_client.xinfo_stream(stream_name)
+                print(f"\nStream '{stream_name}' info:")
+                print(f"  Length: {stream_info['length']}")
+                print(f"  First entry ID: {stream_info.get('first-entry', 'None')}")
+                print(f"  Last entry ID: {stream_info.get('last-entry', 'None')}")
                 
-        except redis.ResponseError as e:
-            if "no such key" in str(e).lower():
-                print(f"Stream '{self.stream_name}' does not exist yet")
-            else:
-                print(f"Error getting stream info: {e}")
+                # Show all entries in the stream
+                entries = self.redis_client.xrange(stream_name)
+                print(f"\nStream entries:")
+                for entry_id, fields in entries:
+                    print(f"  {entry_id}: {fields}")
+                    
+            except redis.ResponseError as e:
+                if "no such key" in str(e).lower():
+                    print(f"Stream '{stream_name}' does not exist yet")
+                else:
+                    print(f"Error getting stream info: {e}")
 
 def main():
     """
@@ -179,17 +168,14 @@ def main():
     # Clear any existing stream data
     host.clear_streams()
     
-    # Post quarters to Redis
-    host.post_quarters_to_redis()
-    
-    # Create consumer group for workers
-    host.create_consumer_group("workers")
+    # Post tiles to Redis
+    host.post_tiles_to_redis()
     
     # Show stream information
     host.show_stream_info()
     
-    print("\nQuarters posted to Redis stream successfully!")
-    print(f"Workers can now consume from stream '{host.stream_name}' using consumer group 'workers'")
+    print("\nTiles posted to Redis stream successfully!")
+    print(f"Workers 0-{host.num_workers - 1} can now consume from streams 'mandelbrot:work:<shard>'")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -4,12 +4,21 @@ Mandelbrot Set Renderer
 Reads results from Redis stream and displays as a raster image in a window
 """
 
+import asyncio
+import logging
+import os
 import redis
+import redis.asyncio
 import numpy as np
 import pygame
 import time
 import threading
-from typing import Dict, Tuple, Optional
+from typing import Dict, Optional
+
+log = logging.getLogger("mandelbrot")
+
+# Log a progress summary at INFO level every this many rendered regions
+LOG_SUMMARY_EVERY = 50
 
 class MandelbrotRenderer:
     def __init__(self, canvas_width: int = 800, canvas_height: int = 600,
@@ -25,10 +34,13 @@ class MandelbrotRenderer:
         """
         self.canvas_width = canvas_width
         self.canvas_height = canvas_height
+        self.redis_host = redis_host
+        self.redis_port = redis_port
         
         # Connect to Redis
         try:
-            self.redis_client = redis.Redis(host=redis_host, port=redis_port, decode_responses=True)
+            # Results carry raw pixel bytes, so leave responses undecoded
+            self.redis_client = redis.Redis(host=redis_host, port=redis_port, decode_responses=False)
             self.redis_client.ping()  # Test connection
             print(f"Renderer connected to Redis at {redis_host}:{redis_port}")
         except redis.ConnectionError:
@@ -43,8 +55,15 @@ class MandelbrotRenderer:
         self.screen = pygame.display.set_mode((canvas_width, canvas_height))
         pygame.display.set_caption("Mandelbrot Set - Distributed Rendering")
         
-        # Create image array (RGB)
-        self.image_array = np.zeros((canvas_height, canvas_width, 3), dtype=np.uint8)
+        # Create the image surface once; tiles are written straight into its
+        # pixels, which pygame stores in (x, y) order
+        self.surface = pygame.Surface((canvas_width, canvas_height)).convert()
+        self.surface.fill((0, 0, 0))
+        self.dirty_rects = []
+        
+        # Tiles received by the reader thread, waiting to be drawn by the
+        # main loop as (top_left_x, top_left_y, bottom_right_x, bottom_right_y, pixels)
+        self.pending_tiles = []
         
         # Threading control
         self.running = True
@@ -53,30 +72,53 @@ class MandelbrotRenderer:
         # Statistics
         self.regions_rendered = 0
         self.last_update_time = time.time()
+        self.font = pygame.font.Font(None, 36)
+        self.stats_surface = None
+        self.stats_rect = None
         
     def fill_region(self, top_left_x: int, top_left_y: int, 
                    bottom_right_x: int, bottom_right_y: int, 
-                   color: Tuple[int, int, int]) -> None:
+                   pixels: np.ndarray) -> None:
         """
-        Fill a rectangular region with the specified color
+        Queue a rectangular region to be filled with the specified pixels
+        
+        The host only posts tiles inside the canvas, so the coordinates are
+        used as-is.
         
         Args:
             top_left_x, top_left_y: Top-left corner coordinates
             bottom_right_x, bottom_right_y: Bottom-right corner coordinates
-            color: RGB color tuple
+            pixels: uint8 RGB array with shape (height, width, 3)
+        """
+        with self.lock:
+            self.pending_tiles.append((top_left_x, top_left_y, bottom_right_x, bottom_right_y, pixels))
+    
+    def apply_pending_tiles(self) -> None:
+        """
+        Copy every queued tile into the image surface in one batch
         """
-        # Ensure coordinates are within bounds
-        top_left_x = max(0, min(top_left_x, self.canvas_width - 1))
-        top_left_y = max(0, min(top_left_y, self.canvas_height - 1))
-        bottom_right_x = max(0, min(bottom_right_x, self.canvas_width))
-        bottom_right_y = max(0, min(bottom_right_y, self.canvas_height))
-        
-        # Fill the region in the image array
         with self.lock:
-            self.image_array[top_left_y:bottom_right_y, top_left_x:bottom_right_x] = color
-            self.regions_rendered += 1
+            pending = self.pending_tiles
+            self.pending_tiles = []
+        
+        if not pending:
+            return
+        
+        # The pixels3d view locks the surface, so only hold it for the copies
+        surface_pixels = pygame.surfarray.pixels3d(self.surface)
+        for top_left_x, top_left_y, bottom_right_x, bottom_right_y, pixels in pending:
+            surface_pixels[top_left_x:bottom_right_x, top_left_y:bottom_right_y] = pixels.swapaxes(0, 1)
+            self.dirty_rects.append(pygame.Rect(top_left_x, top_left_y,
+                                                bottom_right_x - top_left_x,
+                                                bottom_right_y - top_left_y))
+        del surface_pixels
+        
+        previous_count = self.regions_rendered
+        self.regions_rendered += len(pending)
+        if self.regions_rendered // LOG_SUMMARY_EVERY != previous_count // LOG_SUMMARY_EVERY:
+            log.info("Rendered %d regions", self.regions_rendered)
     
-    def process_result_entry(self, entry_id: str, fields: dict) -> None:
+    def process_result_entry(self, entry_id: bytes, fields: dict) -> None:
         """
         Process a single result entry from the Redis stream
         
@@ -85,82 +127,98 @@ class MandelbrotRenderer:
             fields: Result data fields
         """
         try:
-            # Extract coordinates and color
-            top_left_x = int(fields["top_left_x"])
-            top_left_y = int(fields["top_left_y"])
-            bottom_right_x = int(fields["bottom_right_x"])
-            bottom_right_y = int(fields["bottom_right_y"])
+            # Extract coordinates
+            top_left_x = int(fields[b"top_left_x"])
+            top_left_y = int(fields[b"top_left_y"])
+            bottom_right_x = int(fields[b"bottom_right_x"])
+            bottom_right_y = int(fields[b"bottom_right_y"])
             
-            color_r = int(fields["color_r"])
-            color_g = int(fields["color_g"])
-            color_b = int(fields["color_b"])
+            # Unpack the tile pixels
+            width = bottom_right_x - top_left_x
+            height = bottom_right_y - top_left_y
+            pixels = np.frombuffer(fields[b"pixels"], dtype=np.uint8).reshape(height, width, 3)
             
-            color = (color_r, color_g, color_b)
-            
-            # Fill the region with the calculated color
-            self.fill_region(top_left_x, top_left_y, bottom_right_x, bottom_right_y, color)
+            # Fill the region with the calculated pixels
+            self.fill_region(top_left_x, top_left_y, bottom_right_x, bottom_right_y, pixels)
             
             # Log progress
-            worker_id = fields.get("worker_id", "unknown")
-            quarter_name = fields.get("quarter_name", "unknown")
-            
-            region_size = (bottom_right_x - top_left_x) * (bottom_right_y - top_left_y)
-            print(f"Rendered {quarter_name} from {worker_id}: "
-                  f"({top_left_x},{top_left_y})-({bottom_right_x},{bottom_right_y}) "
-                  f"RGB{color} [{region_size} pixels]")
+            log.debug("Received %s from %s: (%d,%d)-(%d,%d) [%d pixels]",
+                      fields.get(b"tile_name", b"unknown"), fields.get(b"worker_id", b"unknown"),
+                      top_left_x, top_left_y, bottom_right_x, bottom_right_y, width * height)
             
         except (KeyError, ValueError) as e:
-            print(f"Error processing result entry {entry_id}: {e}")
+            log.warning("Error processing result entry %s: %s", entry_id, e)
     
-    def read_results_from_stream(self) -> None:
+    async def read_results_from_stream(self) -> None:
         """
-        Continuously read results from the Redis stream in a separate thread
+        Continuously read results from the Redis stream using an asyncio client
         """
-        print(f"Starting to read results from stream '{self.result_stream}'")
+        log.debug("Starting to read results from stream '%s'", self.result_stream)
+        client = redis.asyncio.Redis(host=self.redis_host, port=self.redis_port, decode_responses=False)
         last_id = "0"  # Start from the beginning
         
-        while self.running:
-            try:
-                # Read new entries from the stream
-                entries = self.redis_client.xread({self.result_stream: last_id}, 
-                                                count=10, block=1000)
-                
-                if not entries:
-                    continue
-                
-                # Process each entry
-                for stream_name, stream_entries in entries:
-                    for entry_id, fields in stream_entries:
-                        self.process_result_entry(entry_id, fields)
-                        last_id = entry_id
-                        
-            except redis.RedisError as e:
-                if self.running:  # Only log if we're still supposed to be running
-                    print(f"Redis error reading results: {e}")
-                    time.sleep(1)
-            except Exception as e:
-                if self.running:
-                    print(f"Error reading results: {e}")
-                    time.sleep(1)
+        try:
+            while self.running:
+                try:
+                    # Read new entries from the stream, with a short block so
+                    # shutdown is noticed promptly
+                    entries = await client.xread({self.result_stream: last_id},
+                                                 count=256, block=50)
+                    
+                    if not entries:
+                        continue
+                    
+                    # Process each entry
+                    for stream_name, stream_entries in entries:
+                        for entry_id, fields in stream_entries:
+                            self.process_result_entry(entry_id, fields)
+                            last_id = entry_id
+                            
+                except redis.RedisError as e:
+                    if self.running:  # Only log if we're still supposed to be running
+                        log.warning("Redis error reading results: %s", e)
+                        await asyncio.sleep(0.1)
+                except Exception as e:
+                    if self.running:
+                        log.warning("Error reading results: %s", e)
+                        await asyncio.sleep(0.1)
+        finally:
+            await client.aclose()
+    
+    def run_reader(self) -> None:
+        """
+        Run the asyncio result reader until the renderer stops
+        """
+        asyncio.run(self.read_results_from_stream())
     
     def update_display(self) -> None:
         """
         Update the pygame display with the current image
         """
-        with self.lock:
-            # Convert numpy array to pygame surface
-            surface = pygame.surfarray.make_surface(self.image_array.swapaxes(0, 1))
-            self.screen.blit(surface, (0, 0))
-            
-            # Add status text
-            current_time = time.time()
-            if current_time - self.last_update_time > 1.0:  # Update stats every second
-                font = pygame.font.Font(None, 36)
-                text = font.render(f"Regions: {self.regions_rendered}", True, (255, 255, 255))
-                self.screen.blit(text, (10, 10))
-                self.last_update_time = current_time
-            
-            pygame.display.flip()
+        self.apply_pending_tiles()
+        
+        # Copy only the regions that changed since the last frame
+        dirty = self.dirty_rects
+        self.dirty_rects = []
+        for rect in dirty:
+            self.screen.blit(self.surface, rect, rect)
+        
+        # Re-render the cached status text once per second
+        current_time = time.time()
+        if current_time - self.last_update_time > 1.0:  # Update stats every second
+            if self.stats_rect is not None:
+                self.screen.blit(self.surface, self.stats_rect, self.stats_rect)
+                dirty.append(self.stats_rect)
+            self.stats_surface = self.font.render(f"Regions: {self.regions_rendered}", True, (255, 255, 255))
+            self.last_update_time = current_time
+        
+        # Keep the status text on top of anything drawn underneath it
+        if dirty and self.stats_surface is not None:
+            self.stats_rect = self.screen.blit(self.stats_surface, (10, 10))
+            dirty.append(self.stats_rect)
+        
+        if dirty:
+            pygame.display.update(dirty)
     
     def run(self) -> None:
         """
@@ -169,8 +227,8 @@ class MandelbrotRenderer:
         print("Starting Mandelbrot renderer...")
         print("Press ESC or close window to exit")
         
-        # Start the Redis reading thread
-        redis_thread = threading.Thread(target=self.read_results_from_stream, daemon=True)
+        # Start the asyncio Redis reader on its own thread
+        redis_thread = threading.Thread(target=self.run_reader, daemon=True)
         redis_thread.start()
         
         # Main display loop
@@ -206,16 +264,16 @@ class MandelbrotRenderer:
         Args:
             filename: Output filename
         """
-        with self.lock:
-            # Convert numpy array to pygame surface and save
-            surface = pygame.surfarray.make_surface(self.image_array.swapaxes(0, 1))
-            pygame.image.save(surface, filename)
-            print(f"Saved Mandelbrot image to {filename}")
+        self.apply_pending_tiles()
+        pygame.image.save(self.surface, filename)
+        print(f"Saved Mandelbrot image to {filename}")
 
 def main():
     """
     Main function to run the Mandelbrot renderer
     """
+    logging.basicConfig(level=os.getenv('MANDELBROT_LOG_LEVEL', 'WARNING'))
+    
     print("Mandelbrot Set Renderer")
     print("=" * 30)
     
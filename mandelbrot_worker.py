@@ -1,17 +1,142 @@
 #!/usr/bin/env python3
 """
 Mandelbrot Set Worker
-Consumes work from Redis stream, calculates Mandelbrot colors, and subdivides regions
+Consumes tiles from Redis stream, calculates Mandelbrot colors, and posts the tile pixels
+
+The host deals tiles round-robin across MANDELBROT_WORKERS work streams, so
+start one worker per stream with WORKER_SHARD set to 0 .. MANDELBROT_WORKERS-1
+(see mandelbrot_demo.sh). A shard nobody consumes is never rendered.
 """
 
 import redis
+import logging
+import os
 import time
 import uuid
-import math
+import numpy as np
+from numba import cuda, guvectorize
 from typing import Tuple, Dict, Optional
 
+log = logging.getLogger("mandelbrot")
+
+# Log a progress summary at INFO level every this many work items
+LOG_SUMMARY_EVERY = 50
+
+# Pixels iterated together by mandel_row; eight float32 lanes fill an AVX2 register
+LANES = 8
+
+
+@guvectorize(["void(float32, float32[:], int32, uint8[:, :], uint8[:, :])",
+              "void(float64, float64[:], int32, uint8[:, :], uint8[:, :])"],
+             "(),(n),(),(k,c)->(n,c)",
+             target="parallel", nopython=True, fastmath=True, cache=True)
+def mandel_row(ci, cr, maxit, palette, out):
+    """
+    Calculate Mandelbrot colors for one row of pixels
+
+    Called with an array of ci values this broadcasts over rows, and the
+    parallel target spreads the rows across all cores. Constants are built
+    from the input dtype so float32 inputs keep the whole loop in float32.
+
+    Pixels are iterated LANES at a time with no per-pixel branch: escaped
+    lanes keep their last z and stop counting, so LLVM can vectorize the
+    lane loop with selects. A group only stops early once every lane has
+    escaped. Each group's counts are colored through the palette as soon as
+    they are final, so iteration counts never leave the lane scratch.
+
+    Args:
+        ci: Imaginary part shared by every pixel in the row
+        cr: Real part of each pixel in the row
+        maxit: Maximum number of iterations
+        palette: uint8 RGB lookup table indexed by iteration count
+        out: RGB color for each pixel in the row
+    """
+    real = cr.dtype.type
+    zero = real(0.0)
+    two = real(2.0)
+    four = real(4.0)
+    lane_cr = np.empty(LANES, cr.dtype)
+    zr = np.empty(LANES, cr.dtype)
+    zi = np.empty(LANES, cr.dtype)
+    count = np.empty(LANES, np.int32)
+    for start in range(0, cr.shape[0], LANES):
+        lanes = min(LANES, cr.shape[0] - start)
+        for lane in range(LANES):
+            # Padding lanes past the end of the row start out escaped
+            lane_cr[lane] = cr[start + lane] if lane < lanes else zero
+            zr[lane] = zero if lane < lanes else four
+            zi[lane] = zero
+            count[lane] = 0
+        for _ in range(maxit):
+            active = 0
+            for lane in range(LANES):
+                zr2 = zr[lane] * zr[lane]
+                zi2 = zi[lane] * zi[lane]
+                alive = zr2 + zi2 <= four
+                new_zi = two * zr[lane] * zi[lane] + ci
+                new_zr = zr2 - zi2 + lane_cr[lane]
+                zr[lane] = new_zr if alive else zr[lane]
+                zi[lane] = new_zi if alive else zi[lane]
+                count[lane] += alive
+                active += alive
+            if active == 0:
+                break
+        for lane in range(lanes):
+            for channel in range(out.shape[1]):
+                out[start + lane, channel] = palette[count[lane], channel]
+
+
+@cuda.jit(cache=True)
+def mandel_cuda(out, x0, y0, min_x, dx, min_y, dy, maxit):
+    """
+    Calculate Mandelbrot iteration counts on the GPU, one thread per pixel
+
+    Args:
+        out: Device array of iteration counts with shape (height, width)
+        x0, y0: Top-left corner coordinates of the tile
+        min_x, dx, min_y, dy: Complex plane origin and size of one pixel
+        maxit: Maximum number of iterations
+    """
+    x, y = cuda.grid(2)
+    if y < out.shape[0] and x < out.shape[1]:
+        cr = min_x + (x0 + x) * dx
+        ci = min_y + (y0 + y) * dy
+        zr = 0.0
+        zi = 0.0
+        n = 0
+        while n < maxit:
+            zr2 = zr * zr
+            zi2 = zi * zi
+            if zr2 + zi2 > 4.0:
+                break
+            zi = 2.0 * zr * zi + ci
+            zr = zr2 - zi2 + cr
+            n += 1
+        out[y, x] = n
+
+
+@cuda.jit(cache=True)
+def colorize_cuda(iterations, palette, rgb):
+    """
+    Map iteration counts to RGB colors on the GPU
+
+    Args:
+        iterations: Device array of iteration counts with shape (height, width)
+        palette: Device color lookup table with shape (max_iterations + 1, 3)
+        rgb: Device uint8 array with shape (height, width, 3)
+    """
+    x, y = cuda.grid(2)
+    if y < rgb.shape[0] and x < rgb.shape[1]:
+        n = iterations[y, x]
+        rgb[y, x, 0] = palette[n, 0]
+        rgb[y, x, 1] = palette[n, 1]
+        rgb[y, x, 2] = palette[n, 2]
+
+
 class MandelbrotWorker:
-    def __init__(self, worker_id: str = None, redis_host: str = 'localhost', redis_port: int = 6379):
+    def __init__(self, worker_id: str = None, redis_host: str = 'localhost', redis_port: int = 6379,
+                 batch_size: Optional[int] = None, max_idle_polls: Optional[int] = None,
+                 backend: Optional[str] = None, shard: Optional[int] = None):
         """
         Initialize the Mandelbrot worker
         
@@ -19,22 +144,45 @@ class MandelbrotWorker:
             worker_id: Unique identifier for this worker instance
             redis_host: Redis server hostname
             redis_port: Redis server port
+            batch_size: Work items to read per XREAD (defaults to WORKER_BATCH env var or 4)
+            max_idle_polls: Empty reads in a row before the worker exits (defaults to WORKER_MAX_IDLE_POLLS env var or 3)
+            backend: 'cpu' or 'cuda' (defaults to WORKER_BACKEND env var or cpu)
+            shard: Work stream shard to consume (defaults to WORKER_SHARD env var, which
+                   must then be set)
         """
         self.worker_id = worker_id or f"worker-{uuid.uuid4().hex[:8]}"
+        self.batch_size = batch_size or int(os.getenv('WORKER_BATCH', '4'))
+        self.max_idle_polls = max_idle_polls or int(os.getenv('WORKER_MAX_IDLE_POLLS', '3'))
+        self.backend = backend or os.getenv('WORKER_BACKEND', 'cpu')
+        if shard is None:
+            # Defaulting to shard 0 would leave every other shard's tiles
+            # unrendered and the host waiting forever, so insist on it
+            shard_env = os.getenv('WORKER_SHARD')
+            if shard_env is None:
+                raise ValueError("WORKER_SHARD is not set; give each worker its own shard "
+                                 "from 0 to MANDELBROT_WORKERS-1")
+            shard = int(shard_env)
+        self.shard = shard
+        if self.backend not in ('cpu', 'cuda'):
+            raise ValueError(f"Unknown worker backend: {self.backend}")
         
         # Connect to Redis
         try:
             self.redis_client = redis.Redis(host=redis_host, port=redis_port, decode_responses=True)
             self.redis_client.ping()  # Test connection
+            # Work items and results go through an undecoded client so the hot
+            # path skips UTF-8 decoding and tile bytes pass through untouched
+            self.redis_binary_client = redis.Redis(host=redis_host, port=redis_port, decode_responses=False)
             print(f"Worker {self.worker_id} connected to Redis at {redis_host}:{redis_port}")
         except redis.ConnectionError:
             print(f"Failed to connect to Redis at {redis_host}:{redis_port}")
             raise
         
-        # Stream names
-        self.work_stream = "mandelbrot:work"
+        # Stream names. The host deals tiles across one work stream per
+        # worker, so this worker reads its shard from the start with XREAD
+        self.work_stream = f"mandelbrot:work:{self.shard}"
         self.result_stream = "mandelbrot:results"
-        self.consumer_group = "workers"
+        self._last_id = b"0"
         
         # Mandelbrot parameters
         self.max_iterations = 100
@@ -45,294 +193,213 @@ class MandelbrotWorker:
         self.complex_max_x = 1.5
         self.complex_min_y = -2.0
         self.complex_max_y = 2.0
+
+        # Complex plane origin and per-pixel step for each canvas size seen
+        self._canvas_cache = {}
+
+        # float32 doubles the SIMD width of the kernel but runs out of
+        # precision once pixels get smaller than this in the complex plane
+        self.float32_min_pixel_size = 1e-6
+
+        # Color lookup table indexed by iteration count. Points that never
+        # escape (max_iterations) are in the set and stay black
+        t = np.arange(self.max_iterations + 1) / self.max_iterations
+        self.palette = np.stack([
+            (255 * (0.5 + 0.5 * np.sin(3.0 * t))).astype(np.uint8),
+            (255 * (0.5 + 0.5 * np.sin(3.0 * t + 2.0))).astype(np.uint8),
+            (255 * (0.5 + 0.5 * np.sin(3.0 * t + 4.0))).astype(np.uint8),
+        ], axis=1)
+        self.palette[-1] = 0
+        if self.backend == 'cuda':
+            self.device_palette = cuda.to_device(self.palette)
+
+        # Warm the JIT so the first work item doesn't pay the compile cost
+        self.calculate_region_pixels(0, 0, 2, 2, 2, 2)
     
-    def pixel_to_complex(self, pixel_x: int, pixel_y: int, canvas_width: int, canvas_height: int) -> complex:
+    def _scale(self, canvas_width: int, canvas_height: int) -> Tuple[float, float, float, float]:
         """
-        Convert pixel coordinates to complex plane coordinates
-        
+        Get the pixel to complex plane mapping for a canvas size
+
         Args:
-            pixel_x: X coordinate in pixels
-            pixel_y: Y coordinate in pixels
             canvas_width: Total canvas width
             canvas_height: Total canvas height
-            
-        Returns:
-            Complex number representing the point in the complex plane
-        """
-        # Map pixel coordinates to complex plane
-        real = self.complex_min_x + (pixel_x / canvas_width) * (self.complex_max_x - self.complex_min_x)
-        imag = self.complex_min_y + (pixel_y / canvas_height) * (self.complex_max_y - self.complex_min_y)
-        return complex(real, imag)
-    
-    def mandelbrot_iterations(self, c: complex) -> int:
-        """
-        Calculate the number of iterations for a complex point in the Mandelbrot set
-        
-        Args:
-            c: Complex point to test
-            
-        Returns:
-            Number of iterations before escape (or max_iterations if it doesn't escape)
-        """
-        z = 0
-        for n in range(self.max_iterations):
-            if abs(z) > self.escape_radius:
-                return n
-            z = z * z + c
-        return self.max_iterations
-    
-    def iterations_to_color(self, iterations: int) -> Tuple[int, int, int]:
-        """
-        Convert iteration count to RGB color
-        
-        Args:
-            iterations: Number of iterations before escape
-            
+
         Returns:
-            RGB color tuple (r, g, b) with values 0-255
+            Tuple of (min_x, dx, min_y, dy) where dx and dy are the size of
+            one pixel in the complex plane
         """
-        if iterations == self.max_iterations:
-            # Point is in the set - black
-            return (0, 0, 0)
-        
-        # Create a color gradient based on iteration count
-        # Use a smooth color transition
-        t = iterations / self.max_iterations
-        
-        # Create a colorful gradient
-        r = int(255 * (0.5 + 0.5 * math.sin(3.0 * t)))
-        g = int(255 * (0.5 + 0.5 * math.sin(3.0 * t + 2.0)))
-        b = int(255 * (0.5 + 0.5 * math.sin(3.0 * t + 4.0)))
-        
-        return (r, g, b)
-    
-    def calculate_region_color(self, top_left_x: int, top_left_y: int, 
-                             bottom_right_x: int, bottom_right_y: int,
-                             canvas_width: int, canvas_height: int) -> Tuple[int, int, int]:
+        key = (canvas_width, canvas_height)
+        scale = self._canvas_cache.get(key)
+        if scale is None:
+            scale = (self.complex_min_x, (self.complex_max_x - self.complex_min_x) / canvas_width,
+                     self.complex_min_y, (self.complex_max_y - self.complex_min_y) / canvas_height)
+            self._canvas_cache[key] = scale
+        return scale
+
+    def calculate_region_pixels_cuda(self, top_left_x: int, top_left_y: int,
+                                     bottom_right_x: int, bottom_right_y: int,
+                                     canvas_width: int, canvas_height: int) -> np.ndarray:
         """
-        Calculate the Mandelbrot color for the center of a region
-        
+        Calculate the Mandelbrot colors for every pixel in a region on the GPU
+
+        Iteration counts and colors stay on the device, so only the final RGB
+        tile is copied back to the host.
+
         Args:
             top_left_x, top_left_y: Top-left corner coordinates
             bottom_right_x, bottom_right_y: Bottom-right corner coordinates
             canvas_width, canvas_height: Canvas dimensions
-            
+
         Returns:
-            RGB color tuple for the region center
+            C-contiguous uint8 RGB array with shape (height, width, 3)
         """
-        # Calculate center coordinates
-        center_x = (top_left_x + bottom_right_x) // 2
-        center_y = (top_left_y + bottom_right_y) // 2
-        
-        # Convert to complex plane
-        c = self.pixel_to_complex(center_x, center_y, canvas_width, canvas_height)
-        
-        # Calculate iterations and convert to color
-        iterations = self.mandelbrot_iterations(c)
-        return self.iterations_to_color(iterations)
-    
-    def subdivide_region(self, top_left_x: int, top_left_y: int,
-                        bottom_right_x: int, bottom_right_y: int) -> list:
+        width = bottom_right_x - top_left_x
+        height = bottom_right_y - top_left_y
+        min_x, dx, min_y, dy = self._scale(canvas_width, canvas_height)
+
+        threads_per_block = (16, 16)
+        blocks_per_grid = ((width + 15) // 16, (height + 15) // 16)
+
+        d_iterations = cuda.device_array((height, width), dtype=np.uint16)
+        mandel_cuda[blocks_per_grid, threads_per_block](
+            d_iterations, top_left_x, top_left_y, min_x, dx, min_y, dy, self.max_iterations
+        )
+        d_rgb = cuda.device_array((height, width, 3), dtype=np.uint8)
+        colorize_cuda[blocks_per_grid, threads_per_block](d_iterations, self.device_palette, d_rgb)
+        return d_rgb.copy_to_host()
+
+    def calculate_region_pixels(self, top_left_x: int, top_left_y: int,
+                                bottom_right_x: int, bottom_right_y: int,
+                                canvas_width: int, canvas_height: int) -> np.ndarray:
         """
-        Subdivide a region into 4 quarters
+        Calculate the Mandelbrot colors for every pixel in a region
         
         Args:
             top_left_x, top_left_y: Top-left corner coordinates
             bottom_right_x, bottom_right_y: Bottom-right corner coordinates
+            canvas_width, canvas_height: Canvas dimensions
             
         Returns:
-            List of 4 quarter regions with their coordinates
+            C-contiguous uint8 RGB array with shape (height, width, 3)
         """
-        mid_x = (top_left_x + bottom_right_x) // 2
-        mid_y = (top_left_y + bottom_right_y) // 2
+        if self.backend == 'cuda':
+            return self.calculate_region_pixels_cuda(
+                top_left_x, top_left_y, bottom_right_x, bottom_right_y,
+                canvas_width, canvas_height
+            )
 
-        if mid_x == top_left_x and mid_y == top_left_y:
-            return None
-        
-        quarters = [
-            {
-                "quarter": "top_left",
-                "top_left_x": top_left_x,
-                "top_left_y": top_left_y,
-                "bottom_right_x": mid_x,
-                "bottom_right_y": mid_y
-            },
-            {
-                "quarter": "top_right",
-                "top_left_x": mid_x,
-                "top_left_y": top_left_y,
-                "bottom_right_x": bottom_right_x,
-                "bottom_right_y": mid_y
-            },
-            {
-                "quarter": "bottom_left",
-                "top_left_x": top_left_x,
-                "top_left_y": mid_y,
-                "bottom_right_x": mid_x,
-                "bottom_right_y": bottom_right_y
-            },
-            {
-                "quarter": "bottom_right",
-                "top_left_x": mid_x,
-                "top_left_y": mid_y,
-                "bottom_right_x": bottom_right_x,
-                "bottom_right_y": bottom_right_y
-            }
-        ]
-        
-        return quarters
+        min_x, dx, min_y, dy = self._scale(canvas_width, canvas_height)
+        if min(dx, dy) < self.float32_min_pixel_size:
+            dtype = np.float64
+        else:
+            dtype = np.float32
+
+        cr = (min_x + np.arange(top_left_x, bottom_right_x) * dx).astype(dtype)
+        ci = (min_y + np.arange(top_left_y, bottom_right_y) * dy).astype(dtype)
+        return mandel_row(ci, cr, np.int32(self.max_iterations), self.palette)
     
-    def post_result_to_stream(self, region_data: dict, color: Tuple[int, int, int]) -> None:
+    def post_result_to_stream(self, pipe: redis.client.Pipeline, region_data: dict, pixels: np.ndarray) -> None:
         """
-        Post region result to the results stream
+        Queue region result for the results stream on a pipeline
         
         Args:
-            region_data: Original region data from work stream
-            color: Calculated RGB color for the region
+            pipe: Redis pipeline to queue the XADD on
+            region_data: Original region data from work stream, with bytes keys
+            pixels: Calculated uint8 RGB pixels for the region
         """
         result_data = {
             "worker_id": self.worker_id,
-            "quarter_name": region_data.get("quarter_name", "unknown"),
-            "top_left_x": region_data["top_left_x"],
-            "top_left_y": region_data["top_left_y"],
-            "bottom_right_x": region_data["bottom_right_x"],
-            "bottom_right_y": region_data["bottom_right_y"],
-            "color_r": color[0],
-            "color_g": color[1],
-            "color_b": color[2],
-            "timestamp": int(time.time()),
-            "canvas_width": region_data["canvas_width"],
-            "canvas_height": region_data["canvas_height"]
+            "tile_name": region_data.get(b"tile_name", b"unknown"),
+            "top_left_x": region_data[b"top_left_x"],
+            "top_left_y": region_data[b"top_left_y"],
+            "bottom_right_x": region_data[b"bottom_right_x"],
+            "bottom_right_y": region_data[b"bottom_right_y"],
+            "pixels": pixels.tobytes(),
+            "canvas_width": region_data[b"canvas_width"],
+            "canvas_height": region_data[b"canvas_height"]
         }
         
-        stream_id = self.redis_client.xadd(self.result_stream, result_data)
-        print(f"Posted result to {self.result_stream}: RGB{color} [Stream ID: {stream_id}]")
+        pipe.xadd(self.result_stream, result_data)
     
-    def post_subdivisions_to_work_stream(self, quarters: list, canvas_width: int, canvas_height: int) -> bool:
-        """
-        Post subdivided quarters back to the work stream
-        
-        Args:
-            quarters: List of quarter regions
-            canvas_width, canvas_height: Canvas dimensions
-            
-        Returns:
-            True if any subdivisions were posted, False if all were too small (1 pixel)
-        """
-        posted_count = 0
-        
-        for quarter in quarters:
-            # Skip regions that are too small (1x1 pixel or smaller)
-            width = quarter["bottom_right_x"] - quarter["top_left_x"]
-            height = quarter["bottom_right_y"] - quarter["top_left_y"]
-            
-            if width <= 1 or height <= 1:
-                print(f"Skipping {quarter['quarter']} subdivision - too small ({width}x{height})")
-                continue
-            
-            work_data = {
-                "quarter_name": f"{quarter['quarter']}_sub",
-                "top_left_x": quarter["top_left_x"],
-                "top_left_y": quarter["top_left_y"],
-                "bottom_right_x": quarter["bottom_right_x"],
-                "bottom_right_y": quarter["bottom_right_y"],
-                "timestamp": int(time.time()),
-                "canvas_width": canvas_width,
-                "canvas_height": canvas_height,
-                "subdivided_by": self.worker_id
-            }
-            
-            stream_id = self.redis_client.xadd(self.work_stream, work_data)
-            print(f"Posted subdivision {quarter['quarter']} back to work stream [Stream ID: {stream_id}]")
-            posted_count += 1
-        
-        return posted_count > 0
-    
-    def process_work_item(self, stream_id: str, fields: dict) -> bool:
+    def process_work_item(self, pipe: redis.client.Pipeline, stream_id: bytes, fields: dict) -> None:
         """
         Process a single work item from the stream
         
         Args:
+            pipe: Redis pipeline to queue the result on
             stream_id: Redis stream entry ID
-            fields: Work item data fields
-            
-        Returns:
-            True if subdivisions were posted (continue processing), False if all subdivisions were 1 pixel (should exit)
+            fields: Work item data fields, with bytes keys
         """
-        print(f"\nProcessing work item {stream_id}: {fields.get('quarter_name', 'unknown')}")
+        log.debug("Processing work item %s: %s", stream_id, fields.get(b"tile_name", b"unknown"))
         
         # Extract coordinates and canvas dimensions
-        top_left_x = int(fields["top_left_x"])
-        top_left_y = int(fields["top_left_y"])
-        bottom_right_x = int(fields["bottom_right_x"])
-        bottom_right_y = int(fields["bottom_right_y"])
-        canvas_width = int(fields["canvas_width"])
-        canvas_height = int(fields["canvas_height"])
-        
-        # Calculate color for the center of this region
-        color = self.calculate_region_color(
+        top_left_x = int(fields[b"top_left_x"])
+        top_left_y = int(fields[b"top_left_y"])
+        bottom_right_x = int(fields[b"bottom_right_x"])
+        bottom_right_y = int(fields[b"bottom_right_y"])
+        canvas_width = int(fields[b"canvas_width"])
+        canvas_height = int(fields[b"canvas_height"])
+        
+        # Calculate colors for every pixel in this region
+        pixels = self.calculate_region_pixels(
             top_left_x, top_left_y, bottom_right_x, bottom_right_y,
             canvas_width, canvas_height
         )
         
-        print(f"Calculated color RGB{color} for region center")
-        
-        # Post result to results stream
-        self.post_result_to_stream(fields, color)
-        
-        # Subdivide the region into quarters
-        quarters = self.subdivide_region(top_left_x, top_left_y, bottom_right_x, bottom_right_y)
-        
-        # Post subdivisions back to work stream
-        if quarters:
-            self.post_subdivisions_to_work_stream(quarters, canvas_width, canvas_height)
-        
-        # Acknowledge the message
-        self.redis_client.xack(self.work_stream, self.consumer_group, stream_id)
-        print(f"Acknowledged work item {stream_id}")
-        
-        if not quarters:
-            print("All subdivisions are 1 pixel or smaller - no more work to generate")
-        
-        return quarters
+        # Queue the whole tile for the results stream
+        self.post_result_to_stream(pipe, fields, pixels)
+        log.debug("Queued %dx%d tile result for %s", pixels.shape[1], pixels.shape[0], self.result_stream)
     
     def run(self) -> None:
         """
         Main worker loop - consume and process messages from the work stream
-        
-        Args:
-            max_messages: Maximum number of messages to process before stopping
         """
         print(f"Worker {self.worker_id} starting to consume from stream '{self.work_stream}'")
-        print(f"Consumer group: '{self.consumer_group}'")
         
         processed_count = 0
+        idle_polls = 0
         
         while True:
             try:
-                # Read messages from the stream using consumer group
-                messages = self.redis_client.xreadgroup(
-                    self.consumer_group,
-                    self.worker_id,
-                    {self.work_stream: '>'},
-                    count=1,
-                    block=5000  # Block for 5 seconds waiting for messages
+                # Read the next batch of messages after the last one processed
+                messages = self.redis_binary_client.xread(
+                    {self.work_stream: self._last_id},
+                    count=self.batch_size,
+                    block=2000  # Block for 2 seconds waiting for messages
                 )
                 
                 if not messages:
-                    print("No new messages, time to die...")
-                    break
+                    idle_polls += 1
+                    if idle_polls >= self.max_idle_polls:
+                        print("No new messages, time to die...")
+                        break
+                    continue
+                idle_polls = 0
                 
-                # Process each message
+                # Process each message, then post all results in one round trip.
+                # A bad work item is reported and skipped so it can't stall the
+                # shard; the read position only moves on once the results are
+                # posted, so a failed post reprocesses the whole batch
+                pipe = self.redis_binary_client.pipeline(transaction=False)
+                batch_count = 0
+                batch_last_id = self._last_id
                 for stream_name, stream_messages in messages:
                     for stream_id, fields in stream_messages:
-                        has_subdivisions = self.process_work_item(stream_id, fields)
-                        processed_count += 1
-                        
-                        # Exit if no more subdivisions can be generated (all are 1 pixel)
-                        if not has_subdivisions:
-                            print(f"Worker {self.worker_id} exiting - all subdivisions are 1 pixel size")
-                            return
+                        batch_last_id = stream_id
+                        try:
+                            self.process_work_item(pipe, stream_id, fields)
+                        except Exception as e:
+                            print(f"Skipping work item {stream_id.decode()}: {e}")
+                            continue
+                        batch_count += 1
+                
+                pipe.execute()
+                self._last_id = batch_last_id
+                processed_count += batch_count
+                log.debug("Posted %d results", batch_count)
+                
+                if processed_count // LOG_SUMMARY_EVERY != (processed_count - batch_count) // LOG_SUMMARY_EVERY:
+                    log.info("Worker %s has processed %d work items", self.worker_id, processed_count)
                         
             except KeyboardInterrupt:
                 print(f"\nWorker {self.worker_id} interrupted by user")
@@ -347,13 +414,18 @@ def main():
     """
     Main function to run the Mandelbrot worker
     """
+    logging.basicConfig(level=os.getenv('MANDELBROT_LOG_LEVEL', 'WARNING'))
+    
     print("Mandelbrot Set Worker")
     print("=" * 30)
     
     # Create and run worker
-    worker = MandelbrotWorker()
+    try:
+        worker = MandelbrotWorker()
+    except ValueError as e:
+        raise SystemExit(f"❌ {e}")
     
-    # Process up to 20 work items
+    # Process work items until the work stream goes idle
     worker.run()
 
 if __name__ == "__main__":
@@ -7,23 +7,34 @@ This script subscribes to Redis channel "music" and plays musical notes based on
 - duration: The duration to play the note (in seconds or beats)
 
 Dependencies:
-    pip install redis numpy sounddevice
+    pip install redis numpy sounddevice orjson
 
 Usage:
     python music_player.py [--redis-host HOST] [--redis-port PORT]
+    python music_player.py --local songs/take_on_me.csv [--speed BPM]
 """
 
+import asyncio
 import redis
-import json
+import redis.asyncio
+import collections
+import orjson
 import time
 import threading
 import argparse
+import itertools
+import logging
+import logging.handlers
 import os
+import queue
+import socket
+import string
 import sys
 from typing import Dict, Optional, Any
 from datetime import datetime
 from pathlib import Path
 import soundfile as sf
+from numba import njit
 
 # Try to import audio libraries
 try:
@@ -34,6 +45,119 @@ except ImportError:
     AUDIO_AVAILABLE = False
     print("⚠️  Audio libraries not available. Install with: pip install numpy sounddevice")
 
+log = logging.getLogger("music")
+
+# Most pub/sub messages to take from the connection per wakeup
+PUBSUB_BATCH_SIZE = 32
+
+# Most finished tones kept; the least recently played are dropped first
+TONE_CACHE_SIZE = 256
+
+# The player holds its Redis connections for hours, so use RESP3 replies,
+# TCP keepalive so idle links aren't silently dropped, and periodic health checks
+REDIS_CONNECTION_OPTIONS = {
+    'protocol': 3,
+    'socket_keepalive': True,
+    'socket_keepalive_options': {socket.TCP_KEEPIDLE: 30} if hasattr(socket, 'TCP_KEEPIDLE') else {},
+    'health_check_interval': 30,
+}
+
+
+@njit(cache=True, fastmath=True)
+def build_tone(out, step, fade_samples, padding_samples, volume):
+    """
+    Fill a buffer with an enveloped sine tone in a single pass
+
+    The sine comes from the oscillator recurrence
+    s[n+1] = 2 cos(step) s[n] - s[n-1], a multiply and a subtract per sample
+    instead of a sine. State is kept in float64 so the amplitude doesn't
+    drift over long notes. The envelope ramps up over fade_samples, holds at
+    volume, ramps down over fade_samples and is silent for the final
+    padding_samples.
+
+    Args:
+        out: int16 or float buffer to fill
+        step: Phase advance per sample in radians
+        fade_samples: Length of the fade in and fade out ramps
+        padding_samples: Silent samples at the end of the tone
+        volume: Peak amplitude in the units of out
+    """
+    total_samples = out.shape[0]
+    padding_start = total_samples - padding_samples
+    fade_out_start = padding_start - fade_samples
+    # The fade out wins where the ramps overlap on very short notes
+    fade_in_end = max(min(fade_samples, fade_out_start), 0)
+    ramp = volume / max(fade_samples - 1, 1)
+    c = 2.0 * np.cos(step)
+    s_prev = -np.sin(step)
+    s = 0.0
+    # Each envelope segment gets its own loop, so the long plateau is a
+    # plain scale with no per-sample branching
+    for i in range(fade_in_end):
+        out[i] = s * (i * ramp)
+        s, s_prev = c * s - s_prev, s
+    for i in range(fade_in_end, fade_out_start):
+        out[i] = s * volume
+        s, s_prev = c * s - s_prev, s
+    for i in range(max(fade_out_start, 0), padding_start):
+        out[i] = s * (volume - (i - fade_out_start) * ramp)
+        s, s_prev = c * s - s_prev, s
+    out[padding_start:] = 0.0
+
+
+def write_tone(out: np.ndarray, frequency: float, sample_rate: int, volume: float) -> None:
+    """
+    Fill an int16 buffer with one note's tone, envelope and trailing padding.
+
+    Args:
+        out: int16 buffer sized to the note's length
+        frequency: Frequency in Hz
+        sample_rate: Audio sample rate in Hz
+        volume: Volume (0.0 to 1.0)
+    """
+    total_samples = len(out)
+    fade_samples = int(0.005 * sample_rate)
+    # Padding is needed to avoid clicks. This seems to be a limitation of lib sounddevice
+    padding_samples = int(0.04 * sample_rate)
+    if padding_samples + 2 * fade_samples > total_samples:
+        padding_samples = 0
+    build_tone(out, 2 * np.pi * frequency / sample_rate,
+               fade_samples, padding_samples, volume * 32767)
+
+
+def note_spellings(frequencies: Dict[str, float], default_octave: str = '4') -> Dict[str, float]:
+    """
+    Expand a note frequency table with every accepted spelling of each note.
+
+    Adds the note without an octave (meaning default_octave) and every
+    upper/lower case combination, so a lookup needs no normalization.
+
+    Args:
+        frequencies: Frequencies keyed by upper-case note name with octave
+        default_octave: Octave assumed when a note name has none
+
+    Returns:
+        Frequencies keyed by every accepted spelling
+    """
+    names = dict(frequencies)
+    for name, frequency in frequencies.items():
+        if name.endswith(default_octave):
+            names.setdefault(name[:-len(default_octave)], frequency)
+    spellings = {}
+    for name, frequency in names.items():
+        for cased in itertools.product(*({char.upper(), char.lower()} for char in name)):
+            spellings[''.join(cased)] = frequency
+    return spellings
+
+
+class DeferredQueueHandler(logging.handlers.QueueHandler):
+    """Queue records as they are so the listener thread does the formatting."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # QueueHandler.prepare formats the message on the logging thread so
+        # records can be pickled; the queue here never leaves the process
+        return record
+
 
 class MusicPlayer:
     """A class to play musical notes from Redis channel."""
@@ -64,9 +188,16 @@ class MusicPlayer:
         'R': 0.0,
     }
 
+    # Every accepted spelling of each note, including octave-less names for octave 4
+    _NOTE_LOOKUP = note_spellings(NOTE_FREQUENCIES)
+
+    # Upper-cases a note name and drops whitespace in a single pass
+    _NOTE_NAME_TABLE = str.maketrans(string.ascii_lowercase, string.ascii_uppercase, string.whitespace)
+
     def __init__(self, redis_host: str = 'localhost', redis_port: int = 6379,
                  redis_db: int = 0, redis_password: Optional[str] = None,
-                 sample_rate: int = 44100, output_file: Optional[str] = None):
+                 sample_rate: int = 44100, output_file: Optional[str] = None,
+                 audio_device: Optional[int] = None, silent: bool = False):
         """
         Initialize the music player.
 
@@ -76,6 +207,8 @@ class MusicPlayer:
             redis_db: Redis database number
             redis_password: Redis password (if required)
             sample_rate: Audio sample rate in Hz
+            audio_device: Output device index to use without probing devices (optional)
+            silent: Don't touch the audio devices at all, just wait out each note
         """
         # Use environment variables as defaults if not provided
         self.redis_host = redis_host or os.getenv('REDIS_HOST', 'localhost')
@@ -85,7 +218,13 @@ class MusicPlayer:
 
         self.sample_rate = sample_rate
         self.output_file = output_file
-        self.output_buffer = np.array([])
+        # Tones played so far, joined into one array when the file is written
+        self.output_buffer = []
+        # Finished tones keyed by (frequency, total_samples, volume). Songs
+        # only use a handful of notes and beat lengths, so after the first
+        # bar each note is a dictionary lookup. The player runs for hours,
+        # so the cache is capped at TONE_CACHE_SIZE in LRU order
+        self._tone_cache = collections.OrderedDict()
         self.is_playing = False
         self.stop_event = threading.Event()
 
@@ -95,10 +234,20 @@ class MusicPlayer:
         # Initialize Redis connection
         self._connect_to_redis()
 
+        # Compile the tone kernel now rather than stalling the first note
+        if AUDIO_AVAILABLE:
+            write_tone(np.empty(16, dtype=np.int16), 440.0, self.sample_rate, 0.0)
+
         # Check audio availability
-        self.audio_available = AUDIO_AVAILABLE
-        if not AUDIO_AVAILABLE:
+        self.audio_available = AUDIO_AVAILABLE and not silent
+        if silent:
+            print("🔇 Running in silent mode")
+        elif not AUDIO_AVAILABLE:
             print("🔇 Running in silent mode (audio libraries not available)")
+        elif audio_device is not None:
+            # Use the requested device without enumerating the hardware
+            sd.default.device = (None, audio_device)
+            print(f"🔊 Using audio device {audio_device}")
         else:
             # Test audio device availability
             try:
@@ -111,7 +260,7 @@ class MusicPlayer:
             except Exception as e:
                 print(f"🔇 Running in silent mode (audio device error: {e})")
                 self.audio_available = False
-        if self.audio_available:
+        if self.audio_available and audio_device is None:
             try:
                 # Try to find a suitable output device
                 default_device = sd.default.device
@@ -129,6 +278,21 @@ class MusicPlayer:
                 print(f"⚠️  Audio error: {e}")
                 print("🔇 Falling back to silent mode")
 
+        # Keep one output stream open for the player's lifetime. play_note
+        # queues tones and the audio callback plays them back to back
+        self._audio_queue = collections.deque()
+        self._audio_offset = 0
+        self._audio_lock = threading.Lock()
+        self._output_stream = None
+        if self.audio_available:
+            try:
+                self._output_stream = sd.OutputStream(samplerate=self.sample_rate, channels=1,
+                                                      dtype='int16', blocksize=256,
+                                                      callback=self._audio_callback)
+                self._output_stream.start()
+            except Exception as e:
+                print(f"🔇 Running in silent mode (audio stream error: {e})")
+                self.audio_available = False
 
     def _connect_to_redis(self):
         """Connect to Redis server."""
@@ -138,7 +302,9 @@ class MusicPlayer:
                 port=self.redis_port,
                 db=self.redis_db,
                 password=self.redis_password,
-                decode_responses=True
+                decode_responses=True,
+                single_connection_client=True,
+                **REDIS_CONNECTION_OPTIONS
             )
             # Test connection
             self.redis_client.ping()
@@ -147,10 +313,38 @@ class MusicPlayer:
             print(f"❌ Failed to connect to Redis: {e}")
             raise
 
+    def _audio_callback(self, outdata, frames, time_info, status):
+        """
+        Fill the output stream's buffer from the queued tones.
+
+        Args:
+            outdata: Output buffer with shape (frames, 1)
+            frames: Number of frames to fill
+            time_info: Stream timing information (unused)
+            status: Stream status flags (unused)
+        """
+        filled = 0
+        with self._audio_lock:
+            while filled < frames and self._audio_queue:
+                tone = self._audio_queue[0]
+                count = min(frames - filled, len(tone) - self._audio_offset)
+                outdata[filled:filled + count, 0] = tone[self._audio_offset:self._audio_offset + count]
+                filled += count
+                self._audio_offset += count
+                if self._audio_offset == len(tone):
+                    self._audio_queue.popleft()
+                    self._audio_offset = 0
+        # Play silence until the next tone is queued
+        outdata[filled:] = 0
+
     def close(self):
+        if self._output_stream is not None:
+            self._output_stream.stop()
+            self._output_stream.close()
         if self.output_file:
             # Save as wav file
-            sf.write(self.output_file, self.output_buffer, self.sample_rate)
+            output = np.concatenate(self.output_buffer) if self.output_buffer else np.array([], dtype=np.int16)
+            sf.write(self.output_file, output, self.sample_rate)
         self.redis_client.close()
 
     def generate_tone(self, frequency: float, duration: float, volume: float = 0.3) -> np.ndarray:
@@ -163,37 +357,50 @@ class MusicPlayer:
             volume: Volume (0.0 to 1.0)
 
         Returns:
-            Audio samples as numpy array
+            int16 PCM samples. Tones are cached, so treat it as read-only
         """
         try:
             if not AUDIO_AVAILABLE:
                 return np.array([])
 
             total_samples = int(self.sample_rate * duration)
-
-            # Generate time array
-            t = np.linspace(0, duration, total_samples, False)
-
-            # Generate sine wave with envelope (fade in/out to avoid clicks)
-            wave = np.sin(2 * np.pi * frequency * t)
-
-            fade_samples = int(0.005 * self.sample_rate)
-            # Padding is needed to avoid clicks. This seems to be a limitation of lib sounddevice
-            padding_samples = int(0.04 * self.sample_rate)
-            if padding_samples + 2 * fade_samples > total_samples:
-                padding_samples = 0
-            envelope = np.linspace(volume, volume, total_samples)
-            envelope[:fade_samples] = np.linspace(0, volume, fade_samples)
-            if padding_samples > 0:
-                envelope[-(fade_samples+padding_samples):-padding_samples] = np.linspace(volume, 0, fade_samples)
-                envelope[-padding_samples:] = np.linspace(0, 0, padding_samples)
-            else:
-                envelope[-fade_samples:] = np.linspace(volume, 0, fade_samples)
-            return (wave * envelope).astype(np.float32)
+            key = (frequency, total_samples, volume)
+            tone = self._tone_cache.get(key)
+            if tone is not None:
+                self._tone_cache.move_to_end(key)
+                return tone
+
+            # Generate sine wave with envelope (fade in/out to avoid clicks).
+            # 16-bit PCM is plenty for a sine at this volume and halves the
+            # bytes handed to the audio device compared to float32
+            tone = np.empty(total_samples, dtype=np.int16)
+            write_tone(tone, frequency, self.sample_rate, volume)
+            tone.flags.writeable = False
+            self._tone_cache[key] = tone
+            if len(self._tone_cache) > TONE_CACHE_SIZE:
+                self._tone_cache.popitem(last=False)
+            return tone
         except Exception as e:
             print(f"generate_tone error: {e}")
             raise e
 
+    @classmethod
+    def note_frequency(cls, note_name: str) -> Optional[float]:
+        """
+        Look up a note's frequency.
+
+        Args:
+            note_name: Note name (e.g., "C4", "A#3", "Bb4")
+
+        Returns:
+            Frequency in Hz, or None if the note isn't recognised
+        """
+        # Only clean up the name if it has stray whitespace or characters
+        frequency = cls._NOTE_LOOKUP.get(note_name)
+        if frequency is None:
+            frequency = cls._NOTE_LOOKUP.get(note_name.translate(cls._NOTE_NAME_TABLE))
+        return frequency
+
     def play_note(self, note_name: str, duration: float):
         """
         Play a musical note.
@@ -202,42 +409,26 @@ class MusicPlayer:
             note_name: Note name (e.g., "C4", "A#3", "Bb4")
             duration: Duration in seconds
         """
-        # Clean up note name
-        note_name = note_name.strip().upper()
-
-        # Get frequency for the note
-        frequency = self.NOTE_FREQUENCIES.get(note_name)
-
-        if frequency is None:
-            print(f"⚠️  Unknown note: {note_name}")
-            # Try to parse as a simple note without octave (default to octave 4)
-            simple_note = note_name.replace('#', '#').replace('B', 'b')
-            if len(simple_note) <= 2 and not any(char.isdigit() for char in simple_note):
-                note_name = simple_note + '4'
-                frequency = self.NOTE_FREQUENCIES.get(note_name)
-
+        frequency = self.note_frequency(note_name)
         if frequency is None:
             print(f"❌ Cannot play note: {note_name}")
             time.sleep(duration)  # Still wait for the duration
             return
 
-        print(f"🎵 Playing {note_name} ({frequency:.2f} Hz) for {duration:.2f}s")
+        log.debug("Playing %s (%.2f Hz) for %.2fs", note_name, frequency, duration)
 
         if self.audio_available:
 
-            # Generate and play the tone
+            # Generate the tone and queue it on the output stream
             tone = self.generate_tone(frequency, duration)
             if len(tone) > 0:
-                try:
-                    sd.play(tone, self.sample_rate)
-                    sd.wait()  # Wait until the note finishes playing
-                    if self.output_file:
-                        self.output_buffer = np.concatenate((self.output_buffer, tone))
-                except Exception as e:
-                    print(f"Sound device exception: {e}")
-        else:
-            # Silent mode - just wait
-            time.sleep(duration)
+                with self._audio_lock:
+                    self._audio_queue.append(tone)
+                if self.output_file:
+                    self.output_buffer.append(tone)
+
+        # Wait out the note while the stream plays it (or silently)
+        time.sleep(duration)
 
     def parse_note_message(self, message: str) -> Optional[Dict[str, Any]]:
         """
@@ -250,7 +441,7 @@ class MusicPlayer:
             Parsed note object or None if invalid
         """
         try:
-            note_obj = json.loads(message)
+            note_obj = orjson.loads(message)
 
             if not isinstance(note_obj, dict):
                 print(f"⚠️  Message is not a JSON object: {message}")
@@ -260,22 +451,23 @@ class MusicPlayer:
                 print(f"⚠️  Message missing 'note' or 'duration': {note_obj}")
                 return None
 
+            # Check the types once here so playback can use the fields as-is
+            if not isinstance(note_obj['note'], str):
+                print(f"⚠️  Invalid note: {note_obj['note']}")
+                return None
+            if not isinstance(note_obj['duration'], (int, float)):
+                print(f"⚠️  Invalid duration: {note_obj['duration']}")
+                return None
+
             return note_obj
 
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             print(f"❌ Invalid JSON message: {message} - {e}")
             return None
 
     def play_note_from_obj(self, note_obj):
-        # Extract note and duration
-        note_name = str(note_obj['note'])
-        try:
-            duration = float(note_obj['duration'])
-        except (ValueError, TypeError):
-            print(f"⚠️  Invalid duration: {note_obj['duration']}")
-
-        # Play the note
-        self.play_note(note_name, duration)
+        # parse_note_message has already checked the field types
+        self.play_note(note_obj['note'], note_obj['duration'])
 
 
     def pubsub_play(self, channel):
@@ -285,21 +477,32 @@ class MusicPlayer:
             pubsub.subscribe(channel)
 
             self.is_playing = True
-
-            # Listen for messages
-            for message in pubsub.listen():
-                if self.stop_event.is_set():
-                    break
-
-                # Skip subscription confirmation message
-                if message['type'] != 'message':
+            parse = self.parse_note_message
+            play = self.play_note_from_obj
+
+            # Listen for messages, draining any backlog in one batch rather
+            # than blocking on the connection once per note
+            while not self.stop_event.is_set():
+                message = pubsub.get_message(timeout=1.0)
+                if message is None:
                     continue
+                batch = [message]
+                while len(batch) < PUBSUB_BATCH_SIZE:
+                    message = pubsub.get_message()
+                    if message is None:
+                        break
+                    batch.append(message)
+
+                for message in batch:
+                    # Skip subscription confirmation message
+                    if message['type'] != 'message':
+                        continue
 
-                # Parse the message
-                note_obj = self.parse_note_message(message['data'])
-                if note_obj is None:
-                    continue
-                self.play_note_from_obj(note_obj)
+                    # Parse the message
+                    note_obj = parse(message['data'])
+                    if note_obj is None:
+                        continue
+                    play(note_obj)
 
 
         except KeyboardInterrupt:
@@ -313,19 +516,60 @@ class MusicPlayer:
             except:
                 pass
 
+    def _enable_keyspace_events(self) -> bool:
+        """
+        Turn on keyspace notifications for string commands, keeping any
+        event classes the server already has enabled.
+
+        Returns:
+            True if SET events will be published, False if the server
+            doesn't allow CONFIG
+        """
+        try:
+            flags = self.redis_client.config_get('notify-keyspace-events')['notify-keyspace-events']
+            if 'K' not in flags or ('$' not in flags and 'A' not in flags):
+                self.redis_client.config_set('notify-keyspace-events', flags + 'K$')
+            return True
+        except redis.ResponseError:
+            return False
+
     def poll_play(self, channel, interval):
         try:
             self.is_playing = True
-            while True:
-                channel_value = self.redis_client.get(channel)
-                if channel_value is None:
+            get = self.redis_client.get
+            parse = self.parse_note_message
+            play = self.play_note_from_obj
+
+            if not self._enable_keyspace_events():
+                # Fall back to polling the key when notifications can't be enabled
+                print(f"⚠️  Keyspace notifications unavailable, polling every {interval}s")
+                while not self.stop_event.is_set():
+                    channel_value = get(channel)
+                    if channel_value is None:
+                        time.sleep(interval)
+                        continue
+                    note_obj = parse(channel_value)
+                    if note_obj is None:
+                        time.sleep(interval)
+                        continue
+                    play(note_obj)
                     time.sleep(interval)
+                return
+
+            # Re-read the key only when the server reports it was set
+            pubsub = self.redis_client.pubsub(ignore_subscribe_messages=True)
+            pubsub.subscribe(f"__keyspace@{self.redis_db}__:{channel}")
+            while not self.stop_event.is_set():
+                message = pubsub.get_message(timeout=1.0)
+                if message is None or message['data'] != 'set':
                     continue
-                note_obj = self.parse_note_message(channel_value)
+                channel_value = get(channel)
+                if channel_value is None:
+                    continue
+                note_obj = parse(channel_value)
                 if note_obj is None:
                     continue
-                self.play_note_from_obj(note_obj)
-                time.sleep(interval)
+                play(note_obj)
 
         except KeyboardInterrupt:
             print("\n🛑 Stopping music player...")
@@ -333,29 +577,104 @@ class MusicPlayer:
             print(f"❌ Error: {e}")
         finally:
             self.is_playing = False
+            if 'pubsub' in locals():
+                pubsub.close()
 
-    def stream_play(self, channel, id):
+    def list_play(self, channel):
+        """
+        Play notes pushed onto a Redis list, blocking until each one arrives.
+
+        Args:
+            channel: Redis list key
+        """
         try:
             self.is_playing = True
-            while True:
-                if id is None:
-                    id = 0
-                print(f"Reading from Redis stream {channel} at id {id}")
-                messages = self.redis_client.xread(streams={channel: id}, count=100, block=1000)
-                for message in messages:
-                    message_channel = message[0]
-                    if message_channel != channel:
-                        print(f"Got the wrong channel {message_channel}")
-                        continue
-                    message_payload = message[1]
+            blpop = self.redis_client.blpop
+            parse = self.parse_note_message
+            play = self.play_note_from_obj
+            while not self.stop_event.is_set():
+                # Time out now and then so a stop request is noticed
+                popped = blpop([channel], timeout=1)
+                if popped is None:
+                    continue
+                note_obj = parse(popped[1])
+                if note_obj is None:
+                    continue
+                play(note_obj)
+
+        except KeyboardInterrupt:
+            print("\n🛑 Stopping music player...")
+        except Exception as e:
+            print(f"❌ Error: {e}")
+        finally:
+            self.is_playing = False
+
+    async def _read_stream(self, client, channel, id, queue: asyncio.Queue):
+        """
+        Read notes from a Redis stream into a queue until stopped.
+
+        Args:
+            client: asyncio Redis client
+            channel: Redis stream name
+            id: Stream ID to read after
+            queue: Queue that receives parsed note objects, then None when done
+        """
+        print(f"Reading from Redis stream {channel} after id {id}")
+        parse = self.parse_note_message
+        try:
+            while not self.stop_event.is_set():
+                messages = await client.xread(streams={channel: id}, count=100, block=1000)
+                # RESP3 replies map each stream name to a list holding its entries
+                for message_payload in messages.get(channel, ()):
                     for message_item in message_payload:
                         id = message_item[0]
                         self.last_stream_id = id
                         data = message_item[1]['data']
-                        note_obj = self.parse_note_message(data)
+                        note_obj = parse(data)
                         if note_obj is None:
                             continue
-                        self.play_note_from_obj(note_obj)
+                        await queue.put(note_obj)
+        finally:
+            await queue.put(None)
+
+    async def _play_queue(self, queue: asyncio.Queue):
+        """
+        Play queued note objects in order until the reader is done.
+
+        Args:
+            queue: Queue of note objects, ending with None
+        """
+        while (note_obj := await queue.get()) is not None:
+            # play_note blocks for the note's duration, so run it off the
+            # event loop and keep reading the stream meanwhile
+            await asyncio.to_thread(self.play_note_from_obj, note_obj)
+
+    async def _stream_play(self, channel, id):
+        client = redis.asyncio.Redis(
+            host=self.redis_host,
+            port=self.redis_port,
+            db=self.redis_db,
+            password=self.redis_password,
+            decode_responses=True,
+            **REDIS_CONNECTION_OPTIONS
+        )
+        # Bounded so the reader stays at most one read ahead of playback
+        queue = asyncio.Queue(maxsize=100)
+        try:
+            await asyncio.gather(self._read_stream(client, channel, id, queue),
+                                 self._play_queue(queue))
+        finally:
+            await client.aclose()
+
+    def stream_play(self, channel, id):
+        try:
+            self.is_playing = True
+            if id is None or id == '$':
+                # Resolve "$" to the current last entry once, so entries
+                # added between reads are never skipped
+                latest = self.redis_client.xrevrange(channel, count=1)
+                id = latest[0][0] if latest else '0-0'
+            asyncio.run(self._stream_play(channel, id))
         except KeyboardInterrupt:
             print("\n🛑 Stopping music player...")
         except Exception as e:
@@ -366,6 +685,45 @@ class MusicPlayer:
 
 
 
+def play_song(csv_file_path: str, speed: float = 120/60, sample_rate: int = 44100,
+              output_file: Optional[str] = None, volume: float = 0.3) -> None:
+    """
+    Synthesize a whole song CSV into one buffer and play it in a single
+    call, without Redis.
+
+    Args:
+        csv_file_path: Path to the song CSV
+        speed: Beats per second
+        sample_rate: Audio sample rate in Hz
+        output_file: Also write the song to this file (optional)
+        volume: Volume (0.0 to 1.0)
+    """
+    # Share the publisher's CSV parsing; only local playback needs pandas
+    from redis_publisher import parse_notes_from_csv
+
+    notes, durations = parse_notes_from_csv(csv_file_path)
+    if len(notes) == 0:
+        print("❌ No valid notes found in CSV file")
+        return
+
+    # Notes start on whole samples, so each note gets its own sample count
+    lengths = (durations / speed * sample_rate).astype(np.int64)
+    ends = np.cumsum(lengths)
+    song = np.zeros(ends[-1], dtype=np.int16)
+    for note_name, start, end in zip(notes, ends - lengths, ends):
+        frequency = MusicPlayer.note_frequency(note_name)
+        if frequency is None:
+            print(f"❌ Cannot play note: {note_name}")
+            continue  # Leave the note's span silent
+        write_tone(song[start:end], frequency, sample_rate, volume)
+
+    print(f"🎵 Playing {len(notes)} notes ({len(song) / sample_rate:.1f}s)")
+    if output_file:
+        sf.write(output_file, song, sample_rate)
+    sd.play(song, sample_rate)
+    sd.wait()
+
+
 def create_argument_parser():
     """Create and configure argument parser."""
     parser = argparse.ArgumentParser(
@@ -421,25 +779,47 @@ Examples:
     parser.add_argument(
         '--redis-type',
         default='pubsub',
-        help='Redis type: poll, pubsub or stream'
+        help='Redis type: poll, list, pubsub or poll_stream'
     )
     parser.add_argument(
         '--poll-interval',
         type=float,
         default=0.5,
-        help='How often to poll redis'
+        help='How often to poll redis if keyspace notifications are unavailable'
     )
     parser.add_argument(
         '--stream-from-id',
-        type=int,
-        default=0,
-        help='How often to poll redis'
+        default='$',
+        help='Stream ID to play after; 0 replays the whole stream (default: $, new notes only)'
     )
     parser.add_argument(
         '--test-sound',
         action='store_true',
         help='Play a test sound'
     )
+    parser.add_argument(
+        '--audio-device',
+        type=int,
+        default=None,
+        help='Output device index; skips probing the audio devices (default: system default)'
+    )
+    parser.add_argument(
+        '--silent',
+        action='store_true',
+        help="Don't play audio, just wait out each note"
+    )
+    parser.add_argument(
+        '--local',
+        metavar='CSV_FILE',
+        default=None,
+        help='Play a song CSV directly, synthesized in one buffer, without Redis'
+    )
+    parser.add_argument(
+        '--speed',
+        type=int,
+        default=120,
+        help='Speed (bpm) for --local (default: 120)'
+    )
     parser.add_argument(
         '--output-file',
         type=str,
@@ -454,7 +834,24 @@ if __name__ == "__main__":
     parser = create_argument_parser()
     args = parser.parse_args()
 
+    # Format and write log records on a background thread so per-note debug
+    # output stays off the playback path
+    log_queue = queue.SimpleQueue()
+    log_listener = logging.handlers.QueueListener(log_queue, logging.StreamHandler())
+    logging.basicConfig(handlers=[DeferredQueueHandler(log_queue)])
+    log.setLevel(os.getenv('MUSIC_LOG_LEVEL', 'WARNING'))
+    log_listener.start()
+
     try:
+        if args.local:
+            if not AUDIO_AVAILABLE:
+                print("❌ Audio libraries not available, cannot play locally")
+                exit(1)
+            if args.audio_device is not None:
+                sd.default.device = (None, args.audio_device)
+            play_song(args.local, args.speed / 60, args.sample_rate, args.output_file)
+            exit(0)
+
         # Initialize music player
         player = MusicPlayer(
             redis_host=args.redis_host,
@@ -462,7 +859,9 @@ if __name__ == "__main__":
             redis_db=args.redis_db,
             redis_password=args.redis_password,
             sample_rate=args.sample_rate,
-            output_file=args.output_file
+            output_file=args.output_file,
+            audio_device=args.audio_device,
+            silent=args.silent
         )
 
         if args.test_sound:
@@ -479,6 +878,12 @@ if __name__ == "__main__":
             player.pubsub_play(args.channel)
         elif args.redis_type == 'poll':
             player.poll_play(args.channel, args.poll_interval)
+        elif args.redis_type == 'list':
+            channel = args.channel
+            # The publisher pushes to "music_list", since set mode leaves a string at "music"
+            if channel == "music":
+                channel = "music_list"
+            player.list_play(channel)
         elif args.redis_type == 'poll_stream':
             channel = args.channel
             # We substitute the channel because the "music" channel definitely won't work.
@@ -497,3 +902,4 @@ if __name__ == "__main__":
     finally:
         if 'player' in locals():
             player.close()
+        log_listener.stop()
@@ -6,23 +6,29 @@ This script provides functionality to publish Python objects to Redis using vari
 - Publish to Redis channels (pub/sub)
 - Store objects in Redis with keys
 - Push objects to Redis lists/queues
+- Add objects to Redis streams
 
 Dependencies:
-    pip install redis
+    pip install redis orjson pandas
 
 Usage:
     python redis_publisher.py
 """
 
 import redis
-import json
+import numpy as np
+import orjson
+import pandas as pd
 import pickle
 import time
-import csv
 import argparse
 import os
+import socket
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Optional, Tuple, Union
+
+# Notes sent per pipeline round trip when publishing to a stream
+STREAM_BATCH_SIZE = 64
 
 
 class RedisPublisher:
@@ -53,7 +59,15 @@ class RedisPublisher:
                 port=port,
                 db=db,
                 password=password,
-                decode_responses=decode_responses
+                decode_responses=decode_responses,
+                # One long-lived connection with RESP3 replies, TCP
+                # keepalive and health checks. redis-py retries commands
+                # that time out by default
+                protocol=3,
+                single_connection_client=True,
+                socket_keepalive=True,
+                socket_keepalive_options={socket.TCP_KEEPIDLE: 30} if hasattr(socket, 'TCP_KEEPIDLE') else {},
+                health_check_interval=30
             )
             # Test connection
             self.redis_client.ping()
@@ -74,7 +88,7 @@ class RedisPublisher:
             Number of subscribers that received the message
         """
         try:
-            message = json.dumps(obj, default=str)
+            message = orjson.dumps(obj, default=str)
             subscribers = self.redis_client.publish(channel, message)
             return subscribers
         except Exception as e:
@@ -93,15 +107,41 @@ class RedisPublisher:
             True if successful
         """
         try:
-            value = json.dumps(obj, default=str)
+            value = orjson.dumps(obj, default=str)
             result = self.redis_client.set(key, value)
             return result
         except Exception as e:
             print(f"❌ Error storing object with key '{key}': {e}")
             raise
 
+    def push_to_list(self, list_name: str, obj: Any, maxlen: Optional[int] = None) -> int:
+        """
+        Push an object onto the tail of a Redis list.
+
+        Args:
+            list_name: Redis list key
+            obj: Object to push
+            maxlen: Keep only this many of the newest entries (optional)
+
+        Returns:
+            Length of the list after the push, before any trim
+        """
+        try:
+            value = orjson.dumps(obj, default=str)
+            if maxlen is None:
+                return self.redis_client.rpush(list_name, value)
+            # Push and trim in one round trip so an unread list stays bounded
+            pipe = self.redis_client.pipeline(transaction=False)
+            pipe.rpush(list_name, value)
+            pipe.ltrim(list_name, -maxlen, -1)
+            return pipe.execute()[0]
+        except Exception as e:
+            print(f"❌ Error pushing to list '{list_name}': {e}")
+            raise
+
     def add_to_stream(self, stream_name: str, obj: Any,
-                     maxlen: Optional[int] = None) -> str:
+                     maxlen: Optional[int] = None,
+                     pipeline: Optional[redis.client.Pipeline] = None) -> str:
         """
         Add an object to a Redis stream.
 
@@ -109,15 +149,17 @@ class RedisPublisher:
             stream_name: Name of the Redis stream
             obj: Object to add
             maxlen: Maximum length of the stream (optional)
+            pipeline: Pipeline to queue the XADD on instead of sending it now (optional)
 
         Returns:
-            Stream entry ID
+            Stream entry ID, or the pipeline if the XADD was queued on one
         """
         try:
-            fields = {'data': json.dumps(obj, default=str)}
+            fields = {'data': orjson.dumps(obj, default=str)}
             # Add timestamp
             fields['timestamp'] = datetime.now().isoformat()
-            entry_id = self.redis_client.xadd(stream_name, fields, maxlen=maxlen)
+            client = self.redis_client if pipeline is None else pipeline
+            entry_id = client.xadd(stream_name, fields, maxlen=maxlen)
             return entry_id
         except Exception as e:
             print(f"❌ Error adding to stream '{stream_name}': {e}")
@@ -130,66 +172,57 @@ class RedisPublisher:
             print("🔌 Redis connection closed")
 
 
-def parse_notes_from_csv(csv_file_path: str) -> List[Dict[str, Any]]:
+def parse_notes_from_csv(csv_file_path: str) -> Tuple[np.ndarray, np.ndarray]:
     """
-    Parse note objects from a CSV file.
+    Parse notes from a CSV file.
 
     Args:
         csv_file_path: Path to the CSV file
 
     Returns:
-        List of note objects with 'note' and 'duration' fields
+        Tuple of (notes, durations): an object array of note names and an
+        aligned float64 array of durations
 
     CSV Format:
         First column: note (string)
         Second column: duration (integer)
     """
-    note_objects = []
-
     try:
-        with open(csv_file_path, 'r', newline='', encoding='utf-8') as csvfile:
-            csv_reader = csv.reader(csvfile)
-
-            # Skip header row if it exists
-            first_row = next(csv_reader, None)
-            if first_row and (first_row[0].lower() in ['note', 'notes', 'description'] or
-                            first_row[1].lower() in ['duration', 'time', 'minutes']):
-                print(f"📋 Skipping header row: {first_row}")
-            else:
-                # Process first row as data if it's not a header
-                if first_row:
-                    try:
-                        note_obj = {
-                            "note": str(first_row[0]).strip(),
-                            "duration": float(first_row[1])
-                        }
-                        note_objects.append(note_obj)
-                    except (ValueError, IndexError) as e:
-                        print(f"⚠️  Skipping invalid row: {first_row} - {e}")
-
-            # Process remaining rows
-            for row_num, row in enumerate(csv_reader, start=2):
-                try:
-                    if len(row) >= 2 and row[0].strip() and row[1].strip():
-                        note_obj = {
-                            "note": str(row[0]).strip(),
-                            "duration": float(row[1])
-                        }
-                        note_objects.append(note_obj)
-                    else:
-                        print(f"⚠️  Skipping empty or incomplete row {row_num}: {row}")
-                except (ValueError, IndexError) as e:
-                    print(f"⚠️  Skipping invalid row {row_num}: {row} - {e}")
-
-        print(f"✅ Parsed {len(note_objects)} note objects from {csv_file_path}")
-        return note_objects
+        # Let pandas' C parser split the file. Both columns are read as
+        # text so bad rows can be reported and skipped rather than failing
+        # the whole file
+        rows = pd.read_csv(csv_file_path, header=None, usecols=[0, 1], names=['note', 'duration'],
+                           dtype=str, keep_default_na=False, skip_blank_lines=False,
+                           encoding='utf-8', engine='c')
+
+        # Skip header row if it exists
+        if len(rows) and (rows.at[0, 'note'].lower() in ['note', 'notes', 'description'] or
+                          rows.at[0, 'duration'].lower() in ['duration', 'time', 'minutes']):
+            print(f"📋 Skipping header row: {rows.iloc[0].tolist()}")
+            rows = rows.iloc[1:]
+
+        # Validate every row at once, then only visit the bad ones to report them
+        notes = rows['note'].str.strip()
+        durations = pd.to_numeric(rows['duration'], errors='coerce')
+        incomplete = (notes == '') | (rows['duration'].str.strip() == '')
+        invalid = ~incomplete & durations.isna()
+        for row_num, note, duration in zip(rows.index[incomplete] + 1, notes[incomplete], rows['duration'][incomplete]):
+            print(f"⚠️  Skipping empty or incomplete row {row_num}: {[note, duration]}")
+        for row_num, note, duration in zip(rows.index[invalid] + 1, notes[invalid], rows['duration'][invalid]):
+            print(f"⚠️  Skipping invalid row {row_num}: {[note, duration]}")
+
+        valid = ~(incomplete | invalid)
+        notes = notes[valid].to_numpy(dtype=object)
+        durations = durations[valid].to_numpy(dtype=np.float64)
+
+        print(f"✅ Parsed {len(notes)} notes from {csv_file_path}")
+        return notes, durations
 
     except FileNotFoundError:
         print(f"❌ CSV file not found: {csv_file_path}")
-        return []
     except Exception as e:
         print(f"❌ Error reading CSV file: {e}")
-        return []
+    return np.array([], dtype=object), np.array([], dtype=np.float64)
 
 
 def create_argument_parser():
@@ -201,6 +234,7 @@ def create_argument_parser():
 Examples:
   python redis_publisher.py songs/sample_notes.csv --redis-type pubsub   # Publish to pub/sub
   python redis_publisher.py songs/sample_notes.csv --redis-type set      # Publish to sets
+  python redis_publisher.py songs/sample_notes.csv --redis-type list     # Publish to lists
   python redis_publisher.py songs/sample_notes.csv --redis-type stream   # Publish to streams
         """
     )
@@ -215,7 +249,7 @@ Examples:
     # Optional arguments
     parser.add_argument(
         '--redis-type',
-        choices=['pubsub', 'set', 'stream'],
+        choices=['pubsub', 'set', 'list', 'stream'],
         default='pubsub',
         help='Redis publishing type (default: pubsub)'
     )
@@ -264,12 +298,13 @@ def publish_notes_from_csv_with_connection(csv_file_path: str, redis_type: str =
                                           speed=120/60):
     """Publish note objects from CSV with custom Redis connection settings."""
 
-    # Parse notes from CSV
-    note_objects = parse_notes_from_csv(csv_file_path)
+    # Parse notes from CSV and adjust speed
+    notes, durations = parse_notes_from_csv(csv_file_path)
 
-    if not note_objects:
+    if len(notes) == 0:
         print("❌ No valid note objects found in CSV file")
         return
+    durations = (durations / speed).tolist()
 
     # Initialize publisher with custom connection settings
     publisher = RedisPublisher(
@@ -279,21 +314,37 @@ def publish_notes_from_csv_with_connection(csv_file_path: str, redis_type: str =
         password=redis_password
     )
 
-    print(f"\n📝 Publishing {len(note_objects)} note objects from CSV to Redis using '{redis_type}' type...\n")
-
-    for note_obj in note_objects:
-        print(note_obj["note"])
-        # adjust speed
-        note_obj["duration"] = note_obj["duration"] / speed
-        if redis_type == "pubsub":
-            publisher.publish_to_channel("music", note_obj)
-        elif redis_type == "set":
-            publisher.set_object("music", note_obj)
-        elif redis_type == "stream":
-            publisher.add_to_stream("music_stream", note_obj, maxlen=100)
-        time.sleep(note_obj["duration"])
-
-    print(f"\n✅ All {len(note_objects)} note objects published to Redis using '{redis_type}' type!")
+    print(f"\n📝 Publishing {len(notes)} note objects from CSV to Redis using '{redis_type}' type...\n")
+
+    if redis_type == "stream":
+        # Stream readers pace playback themselves, so send the notes a batch
+        # per round trip and then wait out the batch's total duration
+        pipe = publisher.redis_client.pipeline(transaction=False)
+        batch_duration = 0.0
+        for index, (note, duration) in enumerate(zip(notes, durations), start=1):
+            print(note)
+            publisher.add_to_stream("music_stream", {"note": note, "duration": duration},
+                                    maxlen=100, pipeline=pipe)
+            batch_duration += duration
+            if index % STREAM_BATCH_SIZE == 0 or index == len(notes):
+                pipe.execute()
+                time.sleep(batch_duration)
+                batch_duration = 0.0
+    else:
+        # Pub/sub, set and list consumers play notes as they arrive, so keep
+        # publishing one note per duration
+        # Lists get their own key since set mode leaves a string at "music"
+        publish = {
+            "pubsub": lambda obj: publisher.publish_to_channel("music", obj),
+            "set": lambda obj: publisher.set_object("music", obj),
+            "list": lambda obj: publisher.push_to_list("music_list", obj, maxlen=100),
+        }[redis_type]
+        for note, duration in zip(notes, durations):
+            print(note)
+            publish({"note": note, "duration": duration})
+            time.sleep(duration)
+
+    print(f"\n✅ All {len(notes)} note objects published to Redis using '{redis_type}' type!")
     publisher.close()
 
 
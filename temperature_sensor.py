@@ -9,33 +9,171 @@ import time
 import random
 import math
 import argparse
-from typing import Optional
-from datetime import datetime
+import os
+import sys
+from typing import List, Optional, Tuple
+from datetime import datetime, timedelta
+import matplotlib
 import matplotlib.pyplot as plt
+import numpy as np
+from numba import njit
 
 HOUR_MSECS = 3600000
+DAY_MSECS = 86400000
+
+# Historical samples sent per TS.MADD
+HISTORICAL_BATCH_SIZE = 2000
+
+# Real-time samples queued on the pipeline before it is sent
+REALTIME_FLUSH_EVERY = 10
+
+# Spikes are reported as the hottest reading in each bucket of this size
+SPIKE_BUCKET_MSECS = 60000
+
+# Most points drawn in a line or scatter plot
+MAX_PLOT_POINTS = 5000
+
+# Samples are at least a second apart, so the five-minute window (both ends
+# inclusive) holds at most this many
+FIVE_MINUTES_MSECS = 300000
+FIVE_MINUTE_SAMPLES = FIVE_MINUTES_MSECS // 1000 + 1
+
+# Radians per hour of the daily and 2-hour load cycles
+_TWO_PI_OVER_24 = 2 * math.pi / 24
+_TWO_PI_OVER_2 = 2 * math.pi / 2
 
 # Set matplotlib to non-blocking mode
 plt.ion()
 
+
+@njit(cache=True)
+def integrate_thermal_model(load_steps, load_factor, current_temp, idle_temp, max_temp,
+                            ambient_step, loads, temps):
+    """
+    Run the load random walk and thermal inertia over a run of samples
+
+    Each step is sequential (the load is clamped and the temperature eases
+    towards the load's target), so this is the one part of the simulation
+    that can't be a NumPy array expression. The temperature's thermal inertia
+    is a first-order linear filter on its own, but the load walk feeding it
+    is clamped and has to be stepped anyway, so both run in the same
+    compiled loop rather than handing the filter to a second pass.
+
+    Args:
+        load_steps: Change in load factor at each sample
+        load_factor: Load factor before the first sample
+        current_temp: Temperature before the first sample
+        idle_temp: Temperature at zero load
+        max_temp: Temperature at full load
+        ambient_step: Temperature added each sample by the ambient temperature
+        loads: Output array for the load factor at each sample
+        temps: Output array for the temperature before noise at each sample
+
+    Returns:
+        Tuple of (load factor, temperature) after the last sample
+    """
+    for i in range(len(load_steps)):
+        load_factor = max(0.0, min(1.0, load_factor + load_steps[i]))
+        load_temp = idle_temp + (max_temp - idle_temp) * load_factor
+        current_temp += (load_temp - current_temp) * 0.1
+        current_temp += ambient_step
+        loads[i] = load_factor
+        temps[i] = current_temp
+    return load_factor, current_temp
+
+def format_timestamps(timestamps) -> np.ndarray:
+    """
+    Format millisecond timestamps as local 'YYYY-MM-DD HH:MM:SS' strings in bulk
+
+    Args:
+        timestamps: Unix timestamps in milliseconds
+
+    Returns:
+        Array of formatted timestamps
+    """
+    timestamps = np.asarray(timestamps, dtype=np.int64)
+    offsets = {datetime.fromtimestamp(ts / 1000).astimezone().utcoffset()
+               for ts in (timestamps[0], timestamps[-1])}
+    if len(offsets) > 1:
+        # The range crosses a daylight saving change, so convert each one
+        return np.array([datetime.fromtimestamp(ts / 1000).strftime('%Y-%m-%d %H:%M:%S')
+                         for ts in timestamps.tolist()])
+    local = (timestamps + offsets.pop() // timedelta(milliseconds=1)).astype('datetime64[ms]')
+    return np.char.replace(np.datetime_as_string(local, unit='s'), 'T', ' ')
+
+
+def thin_for_plot(samples: np.ndarray) -> np.ndarray:
+    """
+    Keep at most MAX_PLOT_POINTS evenly spaced rows so plot time stays bounded
+
+    Args:
+        samples: Array with one row per sample
+
+    Returns:
+        The samples, or an evenly spaced subset of them
+    """
+    if len(samples) <= MAX_PLOT_POINTS:
+        return samples
+    return samples[np.linspace(0, len(samples) - 1, MAX_PLOT_POINTS, dtype=np.int64)]
+
+
+def format_readings(samples: list) -> str:
+    """
+    Format (timestamp, temperature) samples as one line per sample
+
+    Args:
+        samples: (timestamp in milliseconds, temperature) pairs
+
+    Returns:
+        Lines of 'YYYY-MM-DD HH:MM:SS: TT.TT°C'
+    """
+    samples = np.asarray(samples, dtype=np.float64)
+    labels = format_timestamps(samples[:, 0])
+    return '\n'.join(f"{label}: {temperature:.2f}°C"
+                     for label, temperature in zip(labels, samples[:, 1].tolist()))
+
+
 class TemperatureSensor:
-    def __init__(self, redis_host: str = 'localhost', redis_port: int = 6379):
+    def __init__(self, redis_host: str = 'localhost', redis_port: int = 6379,
+                 redis_socket: Optional[str] = None):
         """
         Initialize the temperature sensor simulator
 
         Args:
             redis_host: Redis server hostname
             redis_port: Redis server port
+            redis_socket: Redis Unix socket path, used instead of host and port (optional)
         """
         # Connect to Redis
         try:
-            self.redis_client = redis.Redis(host=redis_host, port=redis_port, decode_responses=True)
+            # One explicitly sized pool shared by the client and its pipelines.
+            # Health checks keep idle connections usable, and the timeouts
+            # make a dead server fail fast
+            pool_options = dict(decode_responses=True, max_connections=8, health_check_interval=30,
+                                socket_timeout=10)
+            if redis_socket:
+                # A Unix socket skips the TCP stack when Redis runs on this machine
+                location = redis_socket
+                self.pool = redis.ConnectionPool(
+                    connection_class=redis.UnixDomainSocketConnection, path=redis_socket,
+                    **pool_options
+                )
+            else:
+                location = f"{redis_host}:{redis_port}"
+                self.pool = redis.ConnectionPool(
+                    host=redis_host, port=redis_port, socket_keepalive=True,
+                    socket_connect_timeout=5, **pool_options
+                )
+            self.redis_client = redis.Redis(connection_pool=self.pool)
             self.redis_client.ping()  # Test connection
-            print(f"Temperature sensor connected to Redis at {redis_host}:{redis_port}")
+            print(f"Temperature sensor connected to Redis at {location}")
         except redis.ConnectionError:
-            print(f"Failed to connect to Redis at {redis_host}:{redis_port}")
+            print(f"Failed to connect to Redis at {location}")
             raise
 
+        # Single samples are queued here and sent together by flush()
+        self._pipe = self.redis_client.pipeline(transaction=False)
+
         # TimeSeries key for CPU temperature
         self.ts_key = "cpu:temperature"
         self.ts_compaction_key = "cpu:temperature:compaction"
@@ -50,6 +188,12 @@ class TemperatureSensor:
         self.load_factor = 0.3  # Current CPU load factor (0.0 to 1.0)
         self.ambient_temp = 22.0  # Room temperature
 
+        # Random draws for bulk simulation; one sample a second still uses random
+        self.rng = np.random.default_rng()
+
+        # Spikes simulated since the last report_spikes()
+        self._spike_log: List[float] = []
+
     def create_timeseries(self) -> None:
         """
         Create a Redis TimeSeries for CPU temperature data
@@ -66,6 +210,7 @@ class TemperatureSensor:
             # Create the timeseries with retention policy and labels
             self.redis_client.ts().create(
                 self.ts_key,
+                retention_msecs=DAY_MSECS,
                 labels={'sensor': 'cpu', 'unit': 'celsius', 'location': 'server'}
             )
             print(f"Created TimeSeries: {self.ts_key}")
@@ -73,6 +218,9 @@ class TemperatureSensor:
         except redis.ResponseError as e:
             if "key already exists" in str(e).lower():
                 print(f"TimeSeries {self.ts_key} already exists")
+                # Samples no longer carry a retention, so make sure a series
+                # left from an earlier run has it
+                self.redis_client.ts().alter(self.ts_key, retention_msecs=DAY_MSECS)
             else:
                 print(f"Error creating TimeSeries: {e}")
                 raise
@@ -119,6 +267,8 @@ class TemperatureSensor:
         Args:
             timestamp: Unix timestamp in milliseconds (current time if None)
         """
+        sin = math.sin
+
         # Random load fluctuations with some persistence
         load_change = random.gauss(0, 0.05)  # Small random changes
 
@@ -128,8 +278,8 @@ class TemperatureSensor:
         else:
             time_factor = (timestamp / 1000) / 3600  # Convert ms to seconds, then to hours
 
-        periodic_load = 0.2 * math.sin(time_factor * 2 * math.pi / 24)  # Daily cycle
-        periodic_load += 0.1 * math.sin(time_factor * 2 * math.pi / 2)   # 2-hour cycle
+        periodic_load = 0.2 * sin(time_factor * _TWO_PI_OVER_24)  # Daily cycle
+        periodic_load += 0.1 * sin(time_factor * _TWO_PI_OVER_2)   # 2-hour cycle
 
         # Update load factor
         self.load_factor += load_change + periodic_load * 0.01
@@ -162,16 +312,65 @@ class TemperatureSensor:
         if random.random() < 0.001:  # 0.1% chance of spike
             spike = random.uniform(5, 15)
             measured_temp += spike
-            print(f"Temperature spike detected: +{spike:.1f}°C")
+            self._spike_log.append(spike)
 
         # Ensure temperature stays within realistic bounds
         measured_temp = max(self.ambient_temp, min(self.max_temp + 5, measured_temp))
 
         return round(measured_temp, 2)
 
+    def simulate_temperatures(self, timestamps: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Simulate load changes and temperatures for many samples at once
+
+        Equivalent to calling simulate_cpu_load_change and
+        calculate_temperature for each timestamp in turn, carrying on from
+        the current load factor and temperature.
+
+        Args:
+            timestamps: Unix timestamps in milliseconds
+
+        Returns:
+            Tuple of (temperatures, load factors), one per timestamp
+        """
+        num_samples = len(timestamps)
+
+        # Random load fluctuations plus the daily and 2-hour load cycles
+        time_factor = (timestamps / 1000) / 3600
+        periodic_load = 0.2 * np.sin(time_factor * _TWO_PI_OVER_24)
+        periodic_load += 0.1 * np.sin(time_factor * _TWO_PI_OVER_2)
+        load_steps = self.rng.normal(0, 0.05, num_samples) + periodic_load * 0.01
+
+        loads = np.empty(num_samples)
+        temperatures = np.empty(num_samples)
+        ambient_influence = (self.ambient_temp - 20.0) * 0.3
+        self.load_factor, self.current_temp = integrate_thermal_model(
+            load_steps, self.load_factor, self.current_temp, self.idle_temp, self.max_temp,
+            ambient_influence * 0.01, loads, temperatures)
+
+        # Add realistic noise and occasional spikes
+        temperatures += self.rng.normal(0, 0.5, num_samples)
+        spike_mask = self.rng.random(num_samples) < 0.001
+        spikes = self.rng.uniform(5, 15, np.count_nonzero(spike_mask))
+        temperatures[spike_mask] += spikes
+        self._spike_log.extend(spikes.tolist())
+
+        # Ensure temperatures stay within realistic bounds
+        np.clip(temperatures, self.ambient_temp, self.max_temp + 5, out=temperatures)
+        return np.round(temperatures, 2, out=temperatures), loads
+
+    def report_spikes(self) -> None:
+        """
+        Print a summary of the spikes simulated since the last report
+        """
+        if self._spike_log:
+            print(f"Temperature spikes detected: {len(self._spike_log)} "
+                  f"(largest +{max(self._spike_log):.1f}°C)")
+        self._spike_log.clear()
+
     def add_temperature_sample(self, temperature: float, timestamp: Optional[int] = None) -> None:
         """
-        Add a temperature sample to the Redis TimeSeries
+        Queue a temperature sample for the Redis TimeSeries; call flush() to send it
 
         Args:
             temperature: Temperature value in Celsius
@@ -180,24 +379,37 @@ class TemperatureSensor:
         if timestamp is None:
             timestamp = int(time.time() * 1000)  # Current time in milliseconds
 
+        self._pipe.ts().add(self.ts_key, timestamp, temperature)
+
+    def flush(self) -> None:
+        """
+        Send every queued temperature sample in one round trip
+        """
         try:
-            TIME24HOURS_MSECS = 86400000
-            self.redis_client.ts().add(self.ts_key, timestamp, temperature, retention_msecs=TIME24HOURS_MSECS)
-        except redis.ResponseError as e:
-            print(f"Error adding sample to TimeSeries: {e}")
+            results = self._pipe.execute(raise_on_error=False)
+        except redis.RedisError as e:
+            print(f"Error adding samples to TimeSeries: {e}")
+            return
+        for result in results:
+            if isinstance(result, redis.ResponseError):
+                print(f"Error adding sample to TimeSeries: {result}")
 
-    def get_timeseries_info(self) -> dict:
+    def add_temperature_samples_bulk(self, samples: List[Tuple[int, float]]) -> None:
         """
-        Get information about the TimeSeries
+        Add many temperature samples to the Redis TimeSeries in one TS.MADD
 
-        Returns:
-            Dictionary containing TimeSeries metadata
+        Args:
+            samples: (timestamp in milliseconds, temperature in Celsius) pairs
         """
         try:
-            return self.redis_client.ts().info(self.ts_key)
+            results = self.redis_client.ts().madd(
+                [(self.ts_key, timestamp, temperature) for timestamp, temperature in samples])
         except redis.ResponseError as e:
-            print(f"Error getting TimeSeries info: {e}")
-            return {}
+            print(f"Error adding samples to TimeSeries: {e}")
+            return
+        errors = [result for result in results if isinstance(result, redis.ResponseError)]
+        if errors:
+            print(f"Error adding {len(errors)} samples to TimeSeries: {errors[0]}")
 
     def simulate_historical_data(self, num_samples: int = 10000, interval_seconds: int = 1) -> None:
         """
@@ -214,28 +426,25 @@ class TemperatureSensor:
         current_time = int(time.time() * 1000)  # Current time in milliseconds
         start_time = current_time - (num_samples * interval_seconds * 1000)
 
-        samples_added = 0
-
-        for i in range(num_samples):
-            # Calculate timestamp for this sample
-            sample_time = start_time + (i * interval_seconds * 1000)
+        # Simulate every sample up front
+        timestamps = start_time + np.arange(num_samples, dtype=np.int64) * (interval_seconds * 1000)
+        temperatures, loads = self.simulate_temperatures(timestamps)
 
-            # Simulate load changes over time
-            self.simulate_cpu_load_change(sample_time)
-
-            # Calculate temperature for this point in time
-            temperature = self.calculate_temperature()
+        samples_added = 0
 
-            # Add sample to TimeSeries
-            self.add_temperature_sample(temperature, sample_time)
-            samples_added += 1
+        # Send the samples a batch per round trip
+        for start in range(0, num_samples, HISTORICAL_BATCH_SIZE):
+            end = min(start + HISTORICAL_BATCH_SIZE, num_samples)
+            self.add_temperature_samples_bulk(
+                list(zip(timestamps[start:end].tolist(), temperatures[start:end].tolist())))
+            samples_added = end
 
             # Progress reporting
-            if samples_added % 1000 == 0:
-                progress = (samples_added / num_samples) * 100
-                print(f"Progress: {samples_added}/{num_samples} samples ({progress:.1f}%) - "
-                      f"Current temp: {temperature:.2f}°C, Load: {self.load_factor:.2f}")
+            progress = (samples_added / num_samples) * 100
+            print(f"Progress: {samples_added}/{num_samples} samples ({progress:.1f}%) - "
+                  f"Current temp: {temperatures[end - 1]:.2f}°C, Load: {loads[end - 1]:.2f}")
 
+        self.report_spikes()
         print(f"✅ Successfully added {samples_added} temperature samples to TimeSeries")
 
     def run_real_time_simulation(self, duration_seconds: int = 60) -> None:
@@ -247,11 +456,13 @@ class TemperatureSensor:
         """
         print(f"Starting real-time temperature simulation for {duration_seconds} seconds...")
 
-        start_time = time.time()
+        # Time the run on the monotonic clock so wall clock adjustments
+        # don't stretch or cut it short; samples still carry wall clock time
+        start_time = time.monotonic()
         samples_added = 0
 
         try:
-            while time.time() - start_time < duration_seconds:
+            while time.monotonic() - start_time < duration_seconds:
                 timestamp = int(time.time() * 1000)  # Current time in milliseconds
                 # Simulate load changes
                 self.simulate_cpu_load_change(timestamp)
@@ -259,45 +470,48 @@ class TemperatureSensor:
                 # Calculate current temperature
                 temperature = self.calculate_temperature()
 
-                # Add sample to TimeSeries
+                # Queue the sample, sending the queue every few samples
                 self.add_temperature_sample(temperature, timestamp)
                 samples_added += 1
+                if samples_added % REALTIME_FLUSH_EVERY == 0:
+                    self.flush()
 
-                # Display current reading
-                print(f"🌡️  CPU Temp: {temperature:5.2f}°C | Load: {self.load_factor:4.2f} | "
-                      f"Samples: {samples_added}")
+                # Overwrite one status line with the current reading
+                sys.stdout.write(f"\r🌡️  CPU Temp: {temperature:5.2f}°C | Load: {self.load_factor:4.2f} | "
+                                 f"Samples: {samples_added}")
+                sys.stdout.flush()
 
                 # Wait for next sample
                 time.sleep(1)
 
         except KeyboardInterrupt:
             print(f"\n⏹️  Simulation stopped by user after {samples_added} samples")
+        finally:
+            self.flush()
 
+        print()
+        self.report_spikes()
         print(f"✅ Real-time simulation completed. Added {samples_added} samples.")
 
-    def display_five_minute_stats(self, info: dict) -> None:
+    def display_five_minute_stats(self, recent_data: list, plot: bool = True) -> None:
         try:
-            # Get last 5 minutes to calculate statistics
-            FIVE_MINUTES_MSECS = 300000
-            recent_data = self.redis_client.ts().range(
-                self.ts_key, info.get('last_timestamp')-FIVE_MINUTES_MSECS, info.get('last_timestamp')
-            )
-
-            if recent_data:
-                temperatures = [float(sample[1]) for sample in recent_data]
-                min_temp = min(temperatures)
-                max_temp = max(temperatures)
-                avg_temp = sum(temperatures) / len(temperatures)
+            if not recent_data:
+                return
 
-                print(f"\nLast five minutes Temperature Range:")
-                print(f"Min: {min_temp:.2f}°C")
-                print(f"Max: {max_temp:.2f}°C")
-                print(f"Avg: {avg_temp:.2f}°C")
+            # Keep the last 5 minutes of the newest samples, oldest first
+            samples = np.asarray(recent_data, dtype=np.float64)[::-1]
+            samples = samples[samples[:, 0] >= samples[-1, 0] - FIVE_MINUTES_MSECS]
+            temperatures = samples[:, 1]
+            min_temp, max_temp, avg_temp = temperatures.min(), temperatures.max(), temperatures.mean()
 
+            print(f"\nLast five minutes Temperature Range:")
+            print(f"Min: {min_temp:.2f}°C")
+            print(f"Max: {max_temp:.2f}°C")
+            print(f"Avg: {avg_temp:.2f}°C")
 
+            if plot:
                 # Display the data on a graph
-                x = [sample[0] for sample in recent_data]
-                y = [float(sample[1]) for sample in recent_data]
+                x, y = thin_for_plot(samples).T
                 plt.figure(figsize=(10, 6))
                 plt.plot(x, y, 'b-', linewidth=1.5)
                 plt.xlabel('Timestamp (milliseconds)')
@@ -305,8 +519,8 @@ class TemperatureSensor:
                 plt.title('Five Minute Temperature Data')
 
                 # Pick ten evenly spaced ticks from the x data
-                x_ticks = x[::len(x)//10]
-                x_labels = [datetime.fromtimestamp(ts / 1000).strftime('%Y-%m-%d %H:%M:%S') for ts in x_ticks]
+                x_ticks = x[::max(1, len(x)//10)]
+                x_labels = format_timestamps(x_ticks)
                 plt.xticks(x_ticks, x_labels, rotation=45)
 
                 plt.grid(True, alpha=0.3)
@@ -320,27 +534,18 @@ class TemperatureSensor:
         except Exception as e:
             print(f"Could not calculate temperature statistics: {e}")
 
-    def display_hourly_averages(self) -> None:
-        hourly_averages = self.redis_client.ts().range(
-            self.ts_key, '-', '+',
-            aggregation_type='avg', bucket_size_msec=HOUR_MSECS
-        )
-
+    def display_hourly_averages(self, hourly_averages: list, plot: bool = True) -> None:
         if hourly_averages:
             print("\nHourly Averages:")
-            for avg in hourly_averages:
-                timestamp = avg[0]
-                temperature = avg[1]
-                timestamp_str = datetime.fromtimestamp(timestamp / 1000).strftime('%Y-%m-%d %H:%M:%S')
-                print(f"{timestamp_str}: {temperature:.2f}°C")
+            print(format_readings(hourly_averages))
 
             # Display the data on a graph
-            if len(hourly_averages) > 0:
-                timestamps = [sample[0] for sample in hourly_averages]
-                temperatures = [float(sample[1]) for sample in hourly_averages]
+            if plot and len(hourly_averages) > 0:
+                samples = np.asarray(hourly_averages, dtype=np.float64)
+                timestamps, temperatures = samples[:, 0], samples[:, 1]
 
-                # Convert timestamps to datetime objects for better x-axis labels
-                datetime_labels = [datetime.fromtimestamp(ts / 1000) for ts in timestamps]
+                # Format timestamps as month, day and time for the x-axis labels
+                datetime_labels = [label[5:16] for label in format_timestamps(timestamps)]
 
                 plt.figure(figsize=(12, 6))
                 plt.bar(range(len(temperatures)), temperatures, width=0.8, color='orange', alpha=0.7)
@@ -350,50 +555,24 @@ class TemperatureSensor:
                 plt.grid(True, alpha=0.3)
 
                 # Set x-axis labels to show datetime
-                plt.xticks(range(len(datetime_labels)),
-                          [dt.strftime('%m-%d %H:%M') for dt in datetime_labels],
-                          rotation=45)
+                plt.xticks(range(len(datetime_labels)), datetime_labels, rotation=45)
                 plt.tight_layout()
                 plt.show(block=False)
                 plt.draw()
                 print("📊 Hourly averages bar chart opened in new window")
-            else:
+            elif plot:
                 print("No hourly average data available for plotting.")
 
-    def display_spikes(self) -> None:
-        spikes = self.redis_client.ts().range(
-            self.ts_key, '-', '+',
-            filter_by_min_value=85.0,
-            filter_by_max_value=100.0,
-        )
+    def display_spikes(self, spikes: list, plot: bool = True) -> None:
         if spikes:
+            # Redis has already reduced the spikes to the hottest one per minute
             print("\nSpikes (>=85°C):")
-            prev_timestamp = None
-            max_value = 0.0
-            max_value_timestamp = None
-            for spike in spikes:
-                timestamp = spike[0]
-                temperature = spike[1]
-                # Consider only spikes that are at least 1 minuteapart
-                if not prev_timestamp or timestamp - prev_timestamp < 60000:
-                    prev_timestamp = timestamp
-                    max_value = max(max_value, temperature)
-                    max_value_timestamp = timestamp
-                    continue
-                if max_value > 0.0:
-                    timestamp_str = datetime.fromtimestamp(max_value_timestamp / 1000).strftime('%Y-%m-%d %H:%M:%S')
-                    print(f"{timestamp_str}: {max_value:.2f}°C")
-                    max_value = 0.0
-                    max_value_timestamp = None
-                prev_timestamp = timestamp
-            if max_value > 0.0:
-                timestamp_str = datetime.fromtimestamp(max_value_timestamp / 1000).strftime('%Y-%m-%d %H:%M:%S')
-                print(f"{timestamp_str}: {max_value:.2f}°C")
+            print(format_readings(spikes))
 
             # Display the data on a graph
-            if len(spikes) > 0:
-                timestamps = [sample[0] for sample in spikes]
-                temperatures = [float(sample[1]) for sample in spikes]
+            if plot and len(spikes) > 0:
+                samples = thin_for_plot(np.asarray(spikes, dtype=np.float64))
+                timestamps, temperatures = samples[:, 0], samples[:, 1]
 
                 plt.figure(figsize=(12, 6))
                 plt.scatter(timestamps, temperatures)
@@ -401,8 +580,8 @@ class TemperatureSensor:
                 plt.ylabel('Temperature (°C)')
                 plt.title('Spikes')
                 # Pick ten evenly spaced ticks from the x data
-                x_ticks = timestamps[::len(timestamps)//10]
-                x_labels = [datetime.fromtimestamp(ts / 1000).strftime('%Y-%m-%d %H:%M:%S') for ts in x_ticks]
+                x_ticks = timestamps[::max(1, len(timestamps)//10)]
+                x_labels = format_timestamps(x_ticks)
                 plt.xticks(x_ticks, x_labels, rotation=45)
                 plt.grid(True, alpha=0.3)
                 plt.tight_layout()
@@ -410,28 +589,26 @@ class TemperatureSensor:
                 plt.draw()
                 print("📊 Spikes scatter plot opened in new window")
 
-    def display_compaction(self) -> None:
-        try:
-            compaction_data = self.redis_client.ts().range(
-                self.ts_compaction_key, '-', '+'
-            )
-            if compaction_data:
-                print("\nHourly Averages (Compaction Data):")
-                for avg in compaction_data:
-                    timestamp = avg[0]
-                    temperature = avg[1]
-                    timestamp_str = datetime.fromtimestamp(timestamp / 1000).strftime('%Y-%m-%d %H:%M:%S')
-                    print(f"{timestamp_str}: {temperature:.2f}°C")
-        except Exception as e:
-            print(f"Could not calculate temperature statistics: {e}")
-
-    def display_statistics(self) -> None:
+    def display_statistics(self, plot: bool = True) -> None:
         """
         Display statistics about the stored temperature data
+
+        Args:
+            plot: Open plot windows as well as printing the statistics
         """
         try:
-            # Get TimeSeries info
-            info = self.get_timeseries_info()
+            # Fetch the info and every query that doesn't depend on it in one round trip
+            pipe = self.redis_client.pipeline(transaction=False)
+            pipe.ts().info(self.ts_key)
+            pipe.ts().revrange(self.ts_key, '-', '+', count=FIVE_MINUTE_SAMPLES)
+            # The compaction rule already keeps hourly averages; LATEST adds
+            # the hour still in progress
+            pipe.ts().range(self.ts_compaction_key, '-', '+', latest=True)
+            pipe.ts().range(self.ts_key, '-', '+',
+                            filter_by_min_value=85.0, filter_by_max_value=100.0,
+                            aggregation_type='max', bucket_size_msec=SPIKE_BUCKET_MSECS)
+            pipe.ts().info(self.ts_compaction_key)
+            info, recent_data, hourly_averages, spikes, campaction_info = pipe.execute()
 
             print("\n📊 Temperature TimeSeries Statistics:")
             print(f"   Key: {self.ts_key}")
@@ -440,18 +617,16 @@ class TemperatureSensor:
             print(f"   First Timestamp: {info.get('first_timestamp')}")
             print(f"   Last Timestamp: {info.get('last_timestamp')}")
 
-            self.display_five_minute_stats(info)
-            self.display_hourly_averages()
-            self.display_spikes()
+            self.display_five_minute_stats(recent_data, plot)
+            self.display_hourly_averages(hourly_averages, plot)
+            self.display_spikes(spikes, plot)
 
-            campaction_info = self.redis_client.ts().info(self.ts_compaction_key)
             print("\n📊 Temperature TimeSeries Compaction Statistics:")
             print(f"   Key: {self.ts_compaction_key}")
             print(f"   Total Samples: {campaction_info.get('total_samples')}")
             print(f"   Memory Usage: {campaction_info.get('memory_usage')} bytes")
             print(f"   First Timestamp: {campaction_info.get('first_timestamp')}")
             print(f"   Last Timestamp: {campaction_info.get('last_timestamp')}")
-            self.display_compaction()
         except Exception as e:
             print(f"Error displaying statistics: {e}")
 
@@ -470,6 +645,7 @@ Examples:
   python temperature_sensor.py --historical 10000    # Generate 10k historical samples
   python temperature_sensor.py --realtime 300        # Run real-time simulation for 5 minutes
   python temperature_sensor.py --stats               # Show TimeSeries statistics
+  python temperature_sensor.py --stats --no-plot     # Show statistics without plot windows
         """
     )
 
@@ -486,6 +662,13 @@ Examples:
         help='Redis server port (default: 6379)'
     )
 
+    parser.add_argument(
+        '--redis-socket',
+        metavar='PATH',
+        default=None,
+        help='Connect through a Redis Unix socket instead of host and port'
+    )
+
     parser.add_argument(
         '--historical',
         type=int,
@@ -513,6 +696,12 @@ Examples:
         help='Display TimeSeries statistics'
     )
 
+    parser.add_argument(
+        '--no-plot',
+        action='store_true',
+        help='Print statistics without opening plot windows'
+    )
+
     return parser
 
 def main():
@@ -522,20 +711,31 @@ def main():
     parser = create_argument_parser()
     args = parser.parse_args()
 
+    # Without a display there is nowhere to show the plots
+    if (not args.no_plot and sys.platform.startswith('linux')
+            and not (os.environ.get('DISPLAY') or os.environ.get('WAYLAND_DISPLAY'))):
+        print("No display found, skipping plots")
+        args.no_plot = True
+    if args.no_plot:
+        # Don't start a GUI backend for plots that are never drawn
+        matplotlib.use('Agg')
+
     print("🌡️  CPU Temperature Sensor Simulator")
     print("=" * 50)
 
     try:
         # Create temperature sensor instance
-        sensor = TemperatureSensor(redis_host=args.redis_host, redis_port=args.redis_port)
+        sensor = TemperatureSensor(redis_host=args.redis_host, redis_port=args.redis_port,
+                                   redis_socket=args.redis_socket)
 
         if args.stats:
-            sensor.display_statistics()
-            # Keep the script running until user decides to exit
-            try:
-                input("Press Enter to exit...")
-            except KeyboardInterrupt:
-                pass
+            sensor.display_statistics(plot=not args.no_plot)
+            # Keep the plot windows open until user decides to exit
+            if not args.no_plot:
+                try:
+                    input("Press Enter to exit...")
+                except KeyboardInterrupt:
+                    pass
             return
 
         # Create TimeSeries
@@ -553,12 +753,13 @@ def main():
         if not any([args.historical, args.realtime, args.stats]):
             print("No operation specified. Generating 25,000 historical samples...")
             sensor.simulate_historical_data(25000, 1)
-            sensor.display_statistics()
-            # Keep the script running until user decides to exit
-            try:
-                input("Press Enter to exit...")
-            except KeyboardInterrupt:
-                pass
+            sensor.display_statistics(plot=not args.no_plot)
+            # Keep the plot windows open until user decides to exit
+            if not args.no_plot:
+                try:
+                    input("Press Enter to exit...")
+                except KeyboardInterrupt:
+                    pass
 
     except Exception as e:
         print(f"❌ Error: {e}")